@@ -1,3 +0,0 @@
-"""
-Stub package for mcp to satisfy imports in server module.
-"""
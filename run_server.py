@@ -7,41 +7,56 @@ import logging
 import os
 import sys
 
-from src.mcp_server_jira.server import serve
+# Set up logging; LOG_LEVEL (e.g. DEBUG, INFO) overrides the quiet default
+requested_level = os.environ.get("LOG_LEVEL", "WARNING").upper()
+if isinstance(logging.getLevelName(requested_level), int):
+    log_level = requested_level
+else:
+    log_level = "WARNING"
 
-# Set up logging
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
+    level=log_level,
+    format="{asctime} [{levelname}] {message}",
+    style="{",
+    datefmt="%H:%M:%S",
     handlers=[logging.StreamHandler(sys.stdout)]
 )
 
 logger = logging.getLogger()
+if log_level != requested_level:
+    logger.warning("Unknown LOG_LEVEL %r, falling back to WARNING", requested_level)
 
 async def main():
     logger.info("Starting Jira MCP server...")
+
+    # Imported here so the server module (and its dependencies) only loads
+    # once we are actually starting up
+    from src.mcp_server_jira.config import load_config
+    from src.mcp_server_jira.server import serve
     
-    # Get configuration from environment variables
-    server_url = os.environ.get("JIRA_SERVER_URL")
-    auth_method = os.environ.get("JIRA_AUTH_METHOD")
-    username = os.environ.get("JIRA_USERNAME")
-    password = os.environ.get("JIRA_PASSWORD")
-    token = os.environ.get("JIRA_TOKEN")
+    # Get configuration from environment variables (and .env, if present)
+    config = load_config()
     
-    logger.info(f"Server URL: {server_url or 'Not configured'}")
-    logger.info(f"Auth Method: {auth_method or 'Not configured'}")
+    logger.info(f"Server URL: {config.server_url or 'Not configured'}")
+    logger.info(f"Auth Method: {config.auth_method or 'Not configured'}")
     
     try:
         await serve(
-            server_url=server_url,
-            auth_method=auth_method,
-            username=username,
-            password=password,
-            token=token
+            server_url=config.server_url,
+            auth_method=config.auth_method,
+            username=config.username,
+            password=config.password,
+            token=config.token
         )
     except Exception as e:
         logger.error(f"Error running server: {e}")
         raise
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is optional
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
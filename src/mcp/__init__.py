@@ -1 +0,0 @@
-# Stub package for mcp modules
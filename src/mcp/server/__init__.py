@@ -1,49 +0,0 @@
-"""
-Stub package for mcp.server to satisfy imports.
-"""
-
-class Server:
-    """Stubbed Server class"""
-    def __init__(self, *args, **kwargs):
-        """
-        Initializes the Server stub with arbitrary arguments.
-        
-        This constructor accepts any positional or keyword arguments but does not perform any initialization logic.
-        """
-        pass
-
-    def list_tools(self):
-        """
-        Returns a decorator that leaves the decorated function unchanged.
-        
-        This is a placeholder implementation with no operational effect.
-        """
-        def decorator(fn):
-            return fn
-        return decorator
-
-    def call_tool(self):
-        """
-        Returns a decorator that leaves the decorated function unchanged.
-        
-        This is a placeholder implementation with no operational effect.
-        """
-        def decorator(fn):
-            return fn
-        return decorator
-
-    def create_initialization_options(self):
-        """
-        Returns an empty dictionary representing initialization options.
-        
-        This stub method provides a placeholder for initialization configuration.
-        """
-        return {}
-
-    async def run(self, *args, **kwargs):
-        """
-        Placeholder asynchronous method for running the server.
-        
-        This stub implementation does not perform any actions.
-        """
-        pass
@@ -1,11 +0,0 @@
-"""
-Stub stdio_server for mcp.server.stdio
-"""
-
-def stdio_server(*args, **kwargs):
-    """
-    Stub implementation of the stdio_server function for mcp.server.stdio.
-    
-    This function accepts any arguments but performs no operations and always returns None.
-    """
-    return None
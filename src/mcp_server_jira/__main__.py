@@ -1,24 +1,32 @@
 import asyncio
-import os
+from typing import Any, Coroutine
 
+from .config import load_config
 from .server import serve
 
 
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run the coroutine on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is optional
+        asyncio.run(coro)
+    else:
+        uvloop.run(coro)
+
+
 def main() -> None:
-    # Get configuration from environment variables
-    server_url = os.environ.get("JIRA_SERVER_URL")
-    auth_method = os.environ.get("JIRA_AUTH_METHOD")
-    username = os.environ.get("JIRA_USERNAME")
-    password = os.environ.get("JIRA_PASSWORD")
-    token = os.environ.get("JIRA_TOKEN")
-
-    asyncio.run(
+    # Get configuration from environment variables (and .env, if present)
+    config = load_config()
+
+    _run(
         serve(
-            server_url=server_url,
-            auth_method=auth_method,
-            username=username,
-            password=password,
-            token=token,
+            server_url=config.server_url,
+            auth_method=config.auth_method,
+            username=config.username,
+            password=config.password,
+            token=config.token,
         )
     )
 
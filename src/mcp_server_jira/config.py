@@ -0,0 +1,74 @@
+"""
+Configuration loading for the Jira MCP server.
+
+Settings are read from the environment (falling back to an optional .env
+file) and cached until the .env file is modified.
+"""
+
+import functools
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+# Location of the optional .env file with Jira credentials
+ENV_PATH = Path(__file__).parent.parent.parent.parent / ".env"
+
+
+@dataclass(frozen=True, slots=True)
+class JiraConfig:
+    """Immutable Jira connection settings"""
+
+    server_url: Optional[str] = None
+    auth_method: Optional[str] = None
+    username: Optional[str] = None
+    password: Optional[str] = None
+    token: Optional[str] = None
+
+
+def _env_file_mtime(env_path: Path) -> Optional[int]:
+    """Return the .env file's modification time, or None if it is missing"""
+    try:
+        return env_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _parse_env_file(env_path: Path) -> Dict[str, Optional[str]]:
+    """Parse the .env file, returning an empty mapping if dotenv is unavailable"""
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        # dotenv is optional
+        return {}
+
+    return dotenv_values(dotenv_path=env_path)
+
+
+def load_config() -> JiraConfig:
+    """Load the Jira configuration, rebuilding it only when .env changes.
+
+    Values already present in the environment take precedence over the .env
+    file, matching the behaviour of ``dotenv.load_dotenv``.
+    """
+    return _build_config(ENV_PATH, _env_file_mtime(ENV_PATH))
+
+
+@functools.lru_cache(maxsize=1)
+def _build_config(env_path: Path, env_mtime_ns: Optional[int]) -> JiraConfig:
+    """Build the configuration; keyed on the .env mtime so edits are picked up"""
+    file_values = _parse_env_file(env_path) if env_mtime_ns is not None else {}
+
+    def _get(name: str) -> Optional[str]:
+        value = os.environ.get(name)
+        if value is not None:
+            return value
+        return file_values.get(name)
+
+    return JiraConfig(
+        server_url=_get("JIRA_SERVER_URL"),
+        auth_method=_get("JIRA_AUTH_METHOD"),
+        username=_get("JIRA_USERNAME"),
+        password=_get("JIRA_PASSWORD"),
+        token=_get("JIRA_TOKEN"),
+    )
@@ -5,14 +5,332 @@ This module provides direct HTTP client functionality for Jira's v3 REST API,
 offering enhanced functionality and security for operations that require the latest API features.
 """
 
-import json
+import asyncio
+import base64
+import importlib.util
 import logging
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import httpx
 
+from . import json_compat
+
 logger = logging.getLogger("JiraMCPLogger")  # Get the same logger instance
 
+# Default number of concurrent requests used by the batch helpers
+DEFAULT_MAX_WORKERS = 8
+# Connection pool sizing for the shared client; keep-alive connections are
+# reused across calls so back-to-back requests skip the TCP+TLS handshake.
+# Keep at least one idle connection per batch worker so a burst's connections
+# all survive until the next one.
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=16,
+    max_keepalive_connections=max(10, DEFAULT_MAX_WORKERS),
+    keepalive_expiry=30.0,
+)
+# Number of times a failed connection attempt is retried by the transport
+HTTP_CONNECT_RETRIES = 3
+# Overall request timeout, with a tighter bound on establishing connections
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+# HTTP/2 lets concurrent requests share one connection; it needs the h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# Sustained request rate and burst size per Jira site, under Jira Cloud's limits
+REQUESTS_PER_SECOND = 10.0
+REQUEST_BURST = 20
+# Attempts made for a request that Jira answers with a rate-limit status
+HTTP_RETRY_ATTEMPTS = 3
+HTTP_RETRY_STATUSES = frozenset({429, 503})
+# Backoff used when Jira sends no usable Retry-After, doubled per attempt, and
+# the longest wait honoured before giving up
+HTTP_RETRY_BACKOFF = 1.0
+HTTP_RETRY_MAX_DELAY = 30.0
+
+# Maximum number of responses kept from read-only, quasi-static endpoints
+RESPONSE_CACHE_SIZE = 256
+# Seconds a cached quasi-static response is served before it is fetched again
+RESPONSE_CACHE_TTL = 300.0
+# Maximum number of ETag-validated responses kept for conditional GETs
+ETAG_CACHE_SIZE = 128
+# Error bodies larger than this are not parsed for Jira's error messages
+ERROR_BODY_LIMIT = 16 * 1024
+# Jira's cap on issues per /issue/bulk request
+BULK_CREATE_LIMIT = 50
+# Default number of bulk-create chunks in flight at once
+BULK_CREATE_CONCURRENCY = 5
+
+# v3 endpoint paths, relative to /rest/api/3; templates take the issue id or key
+_EP_PROJECT = "/project"
+_EP_PROJECT_SEARCH = "/project/search"
+_EP_ISSUE = "/issue"
+_EP_ISSUE_BULK = "/issue/bulk"
+_EP_ISSUE_TRANSITIONS = "/issue/%s/transitions"
+_EP_ISSUE_COMMENT = "/issue/%s/comment"
+_EP_ISSUETYPE = "/issuetype"
+_EP_SEARCH = "/search/jql"
+
+
+def adf_document(text: str) -> Dict[str, Any]:
+    """Wrap plain text in a single-paragraph Atlassian Document Format document"""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+
+
+def _compact(*pairs: Tuple[str, Any]) -> Dict[str, Any]:
+    """Build a dict from (key, value) pairs in one pass, skipping None values"""
+    return {key: value for key, value in pairs if value is not None}
+
+
+@dataclass(frozen=True, slots=True)
+class CreateProjectRequest:
+    """Arguments for creating a project with the v3 API"""
+
+    key: str
+    assignee: str
+    name: Optional[str] = None
+    ptype: Optional[str] = None
+    template_name: Optional[str] = None
+    avatarId: Optional[int] = None
+    issueSecurityScheme: Optional[int] = None
+    permissionScheme: Optional[int] = None
+    projectCategory: Optional[int] = None
+    notificationScheme: Optional[int] = None
+    categoryId: Optional[int] = None
+    url: Optional[str] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Build the POST /project request body, omitting unset fields"""
+        return _compact(
+            ("key", self.key),
+            ("name", self.name or self.key),
+            ("leadAccountId", self.assignee),
+            ("assigneeType", "PROJECT_LEAD"),
+            ("projectTypeKey", self.ptype),
+            ("projectTemplateKey", self.template_name),
+            ("avatarId", self.avatarId),
+            ("issueSecurityScheme", self.issueSecurityScheme),
+            ("permissionScheme", self.permissionScheme),
+            ("notificationScheme", self.notificationScheme),
+            ("categoryId", self.categoryId or self.projectCategory),
+            ("url", self.url),
+        )
+
+
+# Query parameters, as a mapping or as (name, value) pairs
+_QueryParams = Union[Dict[str, Any], List[Tuple[str, Any]]]
+
+# (base URL, auth header, event loop) identifying a shared HTTP client; pooled
+# connections belong to the loop that opened them, so loops never share one
+_SharedClientKey = Tuple[str, str, Optional[asyncio.AbstractEventLoop]]
+
+class _TokenBucket:
+    """Token bucket limiting how many requests may start per second"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                # Tolerate float rounding left over from the refill arithmetic
+                if self._tokens >= 1 - 1e-9:
+                    self._tokens = max(self._tokens - 1, 0.0)
+                    return
+                await self._sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass(slots=True)
+class _SharedClient:
+    """A pooled HTTP client and the request budget of everyone using it"""
+
+    client: httpx.AsyncClient
+    # Requests in flight and request rate are limited per Jira site, not per
+    # JiraV3APIClient, so extra instances don't multiply the budget
+    request_slots: asyncio.Semaphore
+    rate_limiter: _TokenBucket
+    users: int = 0
+
+
+# HTTP clients shared by every JiraV3APIClient talking to the same Jira site
+# with the same credentials
+_shared_clients: Dict[_SharedClientKey, _SharedClient] = {}
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None when called outside one"""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _acquire_shared_client(key: _SharedClientKey) -> _SharedClient:
+    """Get the pooled HTTP client for `key`, creating it if needed"""
+    # Clients left behind by a finished asyncio.run() can't be closed or reused
+    for stale in [k for k in _shared_clients if k[2] is not None and k[2].is_closed()]:
+        del _shared_clients[stale]
+
+    shared = _shared_clients.get(key)
+    if shared is None or shared.client.is_closed:
+        client = httpx.AsyncClient(
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "Authorization": key[1],
+            },
+            timeout=HTTP_TIMEOUT,
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=HTTP_POOL_LIMITS,
+                retries=HTTP_CONNECT_RETRIES,
+            ),
+        )
+        shared = _SharedClient(
+            client=client,
+            request_slots=asyncio.Semaphore(DEFAULT_MAX_WORKERS),
+            rate_limiter=_TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST),
+        )
+        _shared_clients[key] = shared
+
+    shared.users += 1
+    return shared
+
+
+async def _release_shared_client(key: _SharedClientKey) -> None:
+    """Release one user of a shared HTTP client, closing it after the last one"""
+    shared = _shared_clients.get(key)
+    if shared is None:
+        return
+
+    shared.users -= 1
+    if shared.users <= 0:
+        del _shared_clients[key]
+        await shared.client.aclose()
+
+
+def _log_json(message: str, value: Any) -> None:
+    """Log a value as single-line JSON, serializing it only when DEBUG is enabled"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %s", message, json_compat.dumps(value).decode())
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Seconds to wait before retrying a rate-limited response, or None if the
+    wait Jira asks for is longer than HTTP_RETRY_MAX_DELAY.
+    """
+    try:
+        delay = float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        delay = HTTP_RETRY_BACKOFF * 2**attempt
+    delay = max(delay, 0.0)
+    return delay if delay <= HTTP_RETRY_MAX_DELAY else None
+
+
+def _status_error(response: httpx.Response) -> ValueError:
+    """Build the ValueError raised for a non-2xx response"""
+    error_details = (
+        f"Jira API returned an error: {response.status_code} {response.reason_phrase}."
+    )
+    jira_errors = _jira_error_messages(response)
+    if jira_errors:
+        error_details += f" {jira_errors}"
+    return ValueError(error_details)
+
+
+def _params_key(params: Optional[_QueryParams]) -> Tuple:
+    """Build a hashable, order-independent key from query parameters"""
+    if not params:
+        return ()
+    items = params.items() if isinstance(params, dict) else params
+    return tuple(
+        sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in items
+        )
+    )
+
+
+def _jira_error_messages(response: httpx.Response) -> str:
+    """Extract Jira's error messages from an error response, if it has any"""
+    if "json" not in response.headers.get("Content-Type", ""):
+        return ""
+    if len(response.content) > ERROR_BODY_LIMIT:
+        return ""
+
+    try:
+        body = json_compat.loads(response.content)
+    except json_compat.JSONDecodeError:
+        return ""
+
+    if not isinstance(body, dict):
+        return ""
+
+    messages = _error_collection_messages(body)
+    # Bulk endpoints report one error collection per failed element instead
+    errors = body.get("errors")
+    if isinstance(errors, list):
+        for element in errors:
+            if not isinstance(element, dict):
+                continue
+            element_errors = element.get("elementErrors")
+            if not isinstance(element_errors, dict):
+                continue
+            prefix = f"issue {element.get('failedElementNumber', '?')}: "
+            messages.extend(
+                prefix + message
+                for message in _error_collection_messages(element_errors)
+            )
+    # Some endpoints answer with a plain {"message": ...} instead
+    if not messages and isinstance(body.get("message"), str):
+        messages.append(body["message"])
+    return "; ".join(messages)
+
+
+def _error_collection_messages(collection: Dict[str, Any]) -> List[str]:
+    """Flatten a Jira ErrorCollection into 'message' and 'field: message' strings"""
+    messages = [str(message) for message in collection.get("errorMessages") or []]
+    errors = collection.get("errors")
+    if isinstance(errors, dict):
+        messages.extend(f"{field}: {message}" for field, message in errors.items())
+    return messages
+
 
 class JiraV3APIClient:
     """Client for making direct requests to Jira's v3 REST API"""
@@ -32,7 +350,11 @@ class JiraV3APIClient:
             password: Password for basic auth
             token: API token for auth
         """
+        if not server_url:
+            raise ValueError("Jira server URL is required for v3 API.")
+
         self.server_url = server_url.rstrip("/")
+        self._base_url = self.server_url + "/rest/api/3"
         self.username = username
         self.auth_token = token or password
 
@@ -41,61 +363,205 @@ class JiraV3APIClient:
                 "Jira username and an API token (or password) are required for v3 API."
             )
 
-        self.client = httpx.AsyncClient(
-            auth=(self.username, self.auth_token),
-            headers={"Accept": "application/json", "Content-Type": "application/json"},
-            timeout=30.0,
-            follow_redirects=True,
+        # Encode the Basic credentials once; sending them as a default header
+        # skips httpx's per-request auth flow
+        credentials = f"{self.username}:{self.auth_token}".encode("utf-8")
+        self._auth_header = "Basic " + base64.b64encode(credentials).decode("ascii")
+
+        # Instances for the same site, credentials and event loop share one
+        # connection pool
+        self._client_key: Optional[_SharedClientKey] = (
+            self._base_url,
+            self._auth_header,
+            _running_loop(),
         )
+        shared = _acquire_shared_client(self._client_key)
+        self.client = shared.client
+        # Concurrency and rate budget shared with every user of this pool, so
+        # fan-out helpers don't trip Jira's 429s
+        self._request_slots = shared.request_slots
+        self._rate_limiter = shared.rate_limiter
+
+        # LRU cache of (fetch time, response) from read-only endpoints, keyed
+        # by endpoint
+        self._response_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # LRU cache of (ETag, response) pairs, keyed by endpoint and params
+        self._etag_cache: (
+            "OrderedDict[Tuple[str, Tuple], Tuple[str, Dict[str, Any]]]"
+        ) = OrderedDict()
+        # Used to wait out rate-limit responses before retrying
+        self._retry_sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep
+
+    async def __aenter__(self) -> "JiraV3APIClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release the shared HTTP client, closing it if no other client uses it"""
+        if self._client_key is not None:
+            key, self._client_key = self._client_key, None
+            await _release_shared_client(key)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached read-only responses"""
+        self._response_cache.clear()
+        self._etag_cache.clear()
+
+    async def _cached_get(self, endpoint: str) -> Any:
+        """
+        GET a read-only endpoint, reusing a response up to RESPONSE_CACHE_TTL old.
+
+        Only use this for endpoints whose data rarely changes during a session.
+        Each caller gets its own copy, so mutating a result can't leak into
+        the cache.
+        """
+        now = time.monotonic()
+        cached = self._response_cache.get(endpoint)
+        if cached is not None and now - cached[0] < RESPONSE_CACHE_TTL:
+            self._response_cache.move_to_end(endpoint)
+            logger.debug("Using cached response for %s", endpoint)
+            return json_compat.loads(json_compat.dumps(cached[1]))
+
+        response_data = await self._make_v3_api_request("GET", endpoint)
+        self._response_cache[endpoint] = (now, response_data)
+        self._response_cache.move_to_end(endpoint)
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        return json_compat.loads(json_compat.dumps(response_data))
 
     async def _make_v3_api_request(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[_QueryParams] = None,
+        conditional: bool = False,
     ) -> Dict[str, Any]:
         """
         Sends an authenticated async HTTP request to a Jira v3 REST API endpoint.
+
+        With `conditional`, the response's ETag is remembered and sent back as
+        If-None-Match on the next identical request; a 304 reply then reuses
+        the previously parsed response instead of transferring it again.
+
+        Rate-limited replies (429/503) are retried up to HTTP_RETRY_ATTEMPTS
+        times, waiting for Jira's Retry-After or an exponential backoff.
         """
-        url = f"{self.server_url}/rest/api/3{endpoint}"
+        url = self._base_url + endpoint
+
+        headers = None
+        etag_key = None
+        cached = None
+        if conditional:
+            etag_key = (endpoint, _params_key(params))
+            cached = self._etag_cache.get(etag_key)
+            if cached is not None:
+                headers = {"If-None-Match": cached[0]}
 
-        logger.debug(f"Attempting to make request: {method} {url}")
-        logger.debug(f"Request params: {params}")
-        logger.debug(f"Request JSON data: {data}")
+        logger.debug("Attempting to make request: %s %s", method, url)
+        logger.debug("Request params: %s", params)
+        logger.debug("Request JSON data: %s", data)
 
         try:
-            logger.info(f"AWAITING httpx.client.request for {method} {url}")
-            response = await self.client.request(
-                method=method.upper(),
-                url=url,
-                json=data,
-                params=params,
-            )
+            content = json_compat.dumps(data) if data is not None else None
+            for attempt in range(HTTP_RETRY_ATTEMPTS):
+                logger.info("AWAITING httpx.client.request for %s %s", method, url)
+                async with self._request_slots:
+                    await self._rate_limiter.acquire()
+                    response = await self.client.request(
+                        method=method,
+                        url=url,
+                        content=content,
+                        params=params,
+                        headers=headers,
+                    )
+                if (
+                    response.status_code not in HTTP_RETRY_STATUSES
+                    or attempt == HTTP_RETRY_ATTEMPTS - 1
+                ):
+                    break
+                delay = _retry_delay(response, attempt)
+                if delay is None:
+                    break
+                logger.warning(
+                    "Jira answered %s %s with %s; retrying in %.1fs",
+                    method,
+                    url,
+                    response.status_code,
+                    delay,
+                )
+                # Wait outside the request slot so other calls can proceed
+                await self._retry_sleep(delay)
             logger.info(
-                f"COMPLETED httpx.client.request for {url}. Status: {response.status_code}"
+                "COMPLETED httpx.client.request for %s. Status: %s (%s)",
+                url,
+                response.status_code,
+                response.http_version,
             )
-            logger.debug(f"Raw response text (first 500 chars): {str(response.text)[:500]}")
-
-            response.raise_for_status()
-
-            if response.status_code == 204:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Raw response text (first 500 chars): %s",
+                    response.content[:500].decode("utf-8", errors="replace"),
+                )
+
+            if (
+                etag_key is not None
+                and cached is not None
+                and response.status_code == 304
+            ):
+                self._etag_cache.move_to_end(etag_key)
+                logger.debug("Response for %s not modified", endpoint)
+                return cached[1]
+
+            # Checked inline rather than via raise_for_status, whose exception
+            # and message would only be discarded for our own ValueError
+            if not 200 <= response.status_code < 300:
+                logger.error(
+                    "HTTP Status Error for %r: %s", url, response.status_code
+                )
+                raise _status_error(response)
+
+            if response.status_code == 204 or not response.content:
                 return {}
 
-            return response.json()
+            try:
+                response_data = json_compat.loads(response.content)
+            except json_compat.JSONDecodeError as e:
+                raise ValueError(f"Jira API returned a non-JSON response: {e}")
 
-        except httpx.HTTPStatusError as e:
-            logger.error(
-                f"HTTP Status Error for {e.request.url!r}: {e.response.status_code}",
-                exc_info=True,
-            )
-            error_details = f"Jira API returned an error: {e.response.status_code} {e.response.reason_phrase}."
-            raise ValueError(error_details)
+            etag = response.headers.get("ETag") if etag_key is not None else None
+            if etag_key is not None and etag:
+                self._etag_cache[etag_key] = (etag, response_data)
+                self._etag_cache.move_to_end(etag_key)
+                if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+            return response_data
 
-        except httpx.RequestError as e:
-            logger.error(f"Request Error for {e.request.url!r}", exc_info=True)
-            raise ValueError(f"A network error occurred while connecting to Jira: {e}")
-        except Exception as e:
+        except ValueError:
+            raise
+        except httpx.HTTPError as e:
+            # Status errors only come from transport hooks now that the status
+            # is checked inline; everything else is a network failure
+            if isinstance(e, httpx.HTTPStatusError):
+                logger.error(
+                    "HTTP Status Error for %r: %s",
+                    url,
+                    e.response.status_code,
+                    exc_info=True,
+                )
+                raise _status_error(e.response) from e
+            logger.error("Request Error for %r", url, exc_info=True)
+            raise ValueError(
+                f"A network error occurred while connecting to Jira: {e}"
+            ) from e
+        except Exception:
             logger.critical(
                 "An unexpected error occurred in _make_v3_api_request", exc_info=True
             )
@@ -104,9 +570,9 @@ class JiraV3APIClient:
     async def create_project(
         self,
         key: str,
-        assignee: str,
         name: Optional[str] = None,
-        ptype: str = None,
+        assignee: Optional[str] = None,
+        ptype: Optional[str] = None,
         template_name: Optional[str] = None,
         avatarId: Optional[int] = None,
         issueSecurityScheme: Optional[int] = None,
@@ -114,7 +580,7 @@ class JiraV3APIClient:
         projectCategory: Optional[int] = None,
         notificationScheme: Optional[int] = None,
         categoryId: Optional[int] = None,
-        url: str = None,
+        url: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Creates a new Jira project using the v3 REST API.
@@ -149,30 +615,61 @@ class JiraV3APIClient:
                 "Parameter 'assignee' (leadAccountId) is required by the Jira v3 API"
             )
 
-        payload = {
-            "key": key,
-            "name": name or key,
-            "leadAccountId": assignee,
-            "assigneeType": "PROJECT_LEAD",
-            "projectTypeKey": ptype,
-            "projectTemplateKey": template_name,
-            "avatarId": avatarId,
-            "issueSecurityScheme": issueSecurityScheme,
-            "permissionScheme": permissionScheme,
-            "notificationScheme": notificationScheme,
-            "categoryId": categoryId or projectCategory,
-            "url": url,
-        }
-
-        payload = {k: v for k, v in payload.items() if v is not None}
-
-        print(f"Creating project with v3 API payload: {json.dumps(payload, indent=2)}")
+        payload = CreateProjectRequest(
+            key=key,
+            assignee=assignee,
+            name=name,
+            ptype=ptype,
+            template_name=template_name,
+            avatarId=avatarId,
+            issueSecurityScheme=issueSecurityScheme,
+            permissionScheme=permissionScheme,
+            projectCategory=projectCategory,
+            notificationScheme=notificationScheme,
+            categoryId=categoryId,
+            url=url,
+        ).to_payload()
+
+        logger.debug("Creating project with v3 API payload: %s", payload)
         response_data = await self._make_v3_api_request(
-            "POST", "/project", data=payload
+            "POST", _EP_PROJECT, data=payload
         )
-        print(f"Project creation response: {json.dumps(response_data, indent=2)}")
+        logger.debug("Project creation response: %s", response_data)
         return response_data
 
+    async def create_projects(
+        self,
+        specs: List[Dict[str, Any]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[Any]:
+        """
+        Creates several Jira projects concurrently using the v3 REST API.
+
+        Each spec is passed as keyword arguments to `create_project`. At most
+        `max_workers` requests are in flight at any time.
+
+        Args:
+            specs: List of keyword-argument dicts for `create_project`.
+            max_workers: Maximum number of concurrent create requests.
+
+        Returns:
+            A list with one entry per spec, in the same order: the created
+            project dictionary, or the exception raised for that spec.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def _create(spec: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.create_project(**spec)
+
+        results: List[Any] = await asyncio.gather(
+            *(_create(spec) for spec in specs), return_exceptions=True
+        )
+        return results
+
     async def get_projects(
         self,
         start_at: int = 0,
@@ -218,29 +715,164 @@ class JiraV3APIClient:
         Raises:
             ValueError: If the API request fails
         """
-        params = {
-            "startAt": start_at,
-            "maxResults": max_results,
-            "orderBy": order_by,
-            "id": ids,
-            "keys": keys,
-            "query": query,
-            "typeKey": type_key,
-            "categoryId": category_id,
-            "action": action,
-            "expand": expand,
-        }
-
-        params = {k: v for k, v in params.items() if v is not None}
-
-        endpoint = "/project/search"
-        print(
-            f"Fetching projects with v3 API endpoint: {endpoint} with params: {params}"
+        # Pairs go to httpx as-is; list filters become repeated parameters
+        params = [
+            (k, v)
+            for k, v in (
+                ("startAt", start_at),
+                ("maxResults", max_results),
+                ("orderBy", order_by),
+                ("query", query),
+                ("typeKey", type_key),
+                ("categoryId", category_id),
+                ("action", action),
+                ("expand", expand),
+            )
+            if v is not None
+        ]
+        params.extend(("id", project_id) for project_id in ids or ())
+        params.extend(("keys", key) for key in keys or ())
+
+        endpoint = _EP_PROJECT_SEARCH
+        logger.debug(
+            "Fetching projects with v3 API endpoint: %s with params: %s",
+            endpoint,
+            params,
         )
-        response_data = await self._make_v3_api_request("GET", endpoint, params=params)
-        print(f"Projects API response: {json.dumps(response_data, indent=2)}")
+        response_data = await self._make_v3_api_request(
+            "GET", endpoint, params=params, conditional=True
+        )
+        _log_json("Projects API response", response_data)
         return response_data
 
+    async def get_all_projects(
+        self,
+        page_size: int = 50,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get every project visible to the user using the v3 REST API.
+
+        The first page is fetched on its own; once Jira reports the total, the
+        remaining pages are requested concurrently (at most `max_workers` at a
+        time). If the total is not reported, pages are fetched one by one
+        until Jira marks the last page.
+
+        Args:
+            page_size: Number of projects to request per page (default: 50)
+            max_workers: Maximum number of concurrent page requests
+            **filters: Additional `get_projects` arguments (e.g. query, keys)
+
+        Returns:
+            List of project dictionaries, in Jira's order
+
+        Raises:
+            ValueError: If any page request fails
+        """
+        response = await self.get_projects(
+            start_at=0, max_results=page_size, **filters
+        )
+        projects = list(response.get("values", []))
+        if not projects or response.get("isLast", False):
+            return projects
+
+        total = response.get("total")
+        if total is None:
+            start_at = len(projects)
+            while True:
+                response = await self.get_projects(
+                    start_at=start_at, max_results=page_size, **filters
+                )
+                page = response.get("values", [])
+                if not page:
+                    break
+                projects.extend(page)
+                if response.get("isLast", False):
+                    break
+                start_at += len(page)
+            return projects
+
+        # Jira may cap the page size, so step by what it actually returned
+        step = len(projects)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def _fetch(start_at: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                page = await self.get_projects(
+                    start_at=start_at, max_results=step, **filters
+                )
+            values: List[Dict[str, Any]] = page.get("values", [])
+            return values
+
+        pages = await asyncio.gather(
+            *(_fetch(start_at) for start_at in range(step, total, step))
+        )
+        for page in pages:
+            projects.extend(page)
+        return projects
+
+    async def _iter_pages(
+        self,
+        fetch: Callable[[int, int], Awaitable[Dict[str, Any]]],
+        items_key: str,
+        page_size: int,
+        prefetch: int,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield items from an offset-paginated endpoint, keeping pages in flight.
+
+        The first page is fetched on its own so the step follows the page size
+        Jira actually honours; after that `prefetch` pages are requested
+        together and their items yielded in order before the next batch is
+        scheduled.
+        """
+        response = await fetch(0, page_size)
+        items = response.get(items_key, [])
+        for item in items:
+            yield item
+        if not items or response.get("isLast", False):
+            return
+
+        step = len(items)
+        start_at = step
+        while True:
+            responses = await asyncio.gather(
+                *(fetch(start_at + i * step, step) for i in range(max(1, prefetch)))
+            )
+            for response in responses:
+                items = response.get(items_key, [])
+                for item in items:
+                    yield item
+                if not items or response.get("isLast", False) or len(items) < step:
+                    return
+            start_at += len(responses) * step
+
+    def iter_projects(
+        self, page_size: int = 50, prefetch: int = 2, **filters: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every visible project, prefetching pages ahead of the caller.
+
+        Args:
+            page_size: Number of projects to request per page (default: 50)
+            prefetch: Number of pages requested together (default: 2)
+            **filters: Additional `get_projects` arguments (e.g. query, keys)
+
+        Returns:
+            Async iterator of project dictionaries, in Jira's order
+
+        Raises:
+            ValueError: If any page request fails
+        """
+
+        async def _fetch(start_at: int, max_results: int) -> Dict[str, Any]:
+            return await self.get_projects(
+                start_at=start_at, max_results=max_results, **filters
+            )
+
+        return self._iter_pages(_fetch, "values", page_size, prefetch)
+
     async def get_transitions(
         self,
         issue_id_or_key: str,
@@ -273,22 +905,22 @@ class JiraV3APIClient:
         if not issue_id_or_key:
             raise ValueError("issue_id_or_key is required")
 
-        params = {
-            "expand": expand,
-            "transitionId": transition_id,
-            "skipRemoteOnlyCondition": skip_remote_only_condition,
-            "includeUnavailableTransitions": include_unavailable_transitions,
-            "sortByOpsBarAndStatus": sort_by_ops_bar_and_status,
-        }
-
-        params = {k: v for k, v in params.items() if v is not None}
+        params = _compact(
+            ("expand", expand),
+            ("transitionId", transition_id),
+            ("skipRemoteOnlyCondition", skip_remote_only_condition),
+            ("includeUnavailableTransitions", include_unavailable_transitions),
+            ("sortByOpsBarAndStatus", sort_by_ops_bar_and_status),
+        )
 
-        endpoint = f"/issue/{issue_id_or_key}/transitions"
+        endpoint = _EP_ISSUE_TRANSITIONS % issue_id_or_key
         logger.debug(
-            f"Fetching transitions with v3 API endpoint: {endpoint} with params: {params}"
+            "Fetching transitions with v3 API endpoint: %s with params: %s",
+            endpoint,
+            params,
         )
         response_data = await self._make_v3_api_request("GET", endpoint, params=params)
-        logger.debug(f"Transitions API response: {json.dumps(response_data, indent=2)}")
+        _log_json("Transitions API response", response_data)
         return response_data
 
     async def transition_issue(
@@ -335,24 +967,7 @@ class JiraV3APIClient:
 
         # Add comment if provided - convert simple string to ADF format
         if comment:
-            payload["update"] = {
-                "comment": [
-                    {
-                        "add": {
-                            "body": {
-                                "type": "doc",
-                                "version": 1,
-                                "content": [
-                                    {
-                                        "type": "paragraph",
-                                        "content": [{"type": "text", "text": comment}],
-                                    }
-                                ],
-                            }
-                        }
-                    }
-                ]
-            }
+            payload["update"] = {"comment": [{"add": {"body": adf_document(comment)}}]}
 
         # Add optional metadata
         if history_metadata:
@@ -361,19 +976,62 @@ class JiraV3APIClient:
         if properties:
             payload["properties"] = properties
 
-        endpoint = f"/issue/{issue_id_or_key}/transitions"
-        logger.debug(f"Transitioning issue with v3 API endpoint: {endpoint}")
-        logger.debug(f"Transition payload: {json.dumps(payload, indent=2)}")
+        endpoint = _EP_ISSUE_TRANSITIONS % issue_id_or_key
+        logger.debug("Transitioning issue with v3 API endpoint: %s", endpoint)
+        _log_json("Transition payload", payload)
 
         response_data = await self._make_v3_api_request("POST", endpoint, data=payload)
-        logger.debug(f"Transition response: {response_data}")
+        logger.debug("Transition response: %s", response_data)
         return response_data
 
+    async def transition_issues(
+        self,
+        items: List[Tuple[str, Callable[[List[Dict[str, Any]]], str]]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[Any]:
+        """
+        Transition several issues concurrently using the v3 REST API.
+
+        For each issue, its available transitions are fetched and passed to
+        the paired selector, which returns the ID of the transition to
+        perform. Each issue's fetch-then-transition pair runs as one task,
+        with at most `max_workers` pairs in flight at any time.
+
+        Args:
+            items: List of (issue ID or key, selector) pairs.
+            max_workers: Maximum number of concurrent issues.
+
+        Returns:
+            A list with one entry per item, in the same order: the transition
+            response, or the exception raised for that issue.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def _transition(
+            issue_id_or_key: str,
+            select: Callable[[List[Dict[str, Any]]], str],
+        ) -> Dict[str, Any]:
+            async with semaphore:
+                available = await self.get_transitions(issue_id_or_key)
+                transition_id = select(available.get("transitions", []))
+                return await self.transition_issue(issue_id_or_key, transition_id)
+
+        results: List[Any] = await asyncio.gather(
+            *(_transition(issue, select) for issue, select in items),
+            return_exceptions=True,
+        )
+        return results
+
     async def get_issue_types(self) -> Dict[str, Any]:
         """
         Get all issue types for user using the v3 REST API.
 
         Returns all issue types. This operation can be accessed anonymously.
+        The response is cached for RESPONSE_CACHE_TTL seconds; call
+        `invalidate_cache()` to force a refresh sooner.
 
         Permissions required: Issue types are only returned as follows:
         - if the user has the Administer Jira global permission, all issue types are returned.
@@ -396,10 +1054,10 @@ class JiraV3APIClient:
         Raises:
             ValueError: If the API request fails
         """
-        endpoint = "/issuetype"
-        logger.debug(f"Fetching issue types with v3 API endpoint: {endpoint}")
-        response_data = await self._make_v3_api_request("GET", endpoint)
-        logger.debug(f"Issue types API response: {json.dumps(response_data, indent=2)}")
+        endpoint = _EP_ISSUETYPE
+        logger.debug("Fetching issue types with v3 API endpoint: %s", endpoint)
+        response_data: Dict[str, Any] = await self._cached_get(endpoint)
+        _log_json("Issue types API response", response_data)
         return response_data
 
     async def add_comment(
@@ -437,18 +1095,7 @@ class JiraV3APIClient:
             raise ValueError("comment is required")
 
         # Build the request payload with ADF format
-        payload = {
-            "body": {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [{"type": "text", "text": comment}],
-                    }
-                ],
-            }
-        }
+        payload = {"body": adf_document(comment)}
 
         # Add optional visibility
         if visibility:
@@ -458,10 +1105,14 @@ class JiraV3APIClient:
         if properties:
             payload["properties"] = properties
 
-        endpoint = f"/issue/{issue_id_or_key}/comment"
-        logger.debug(f"Adding comment to issue {issue_id_or_key} with v3 API endpoint: {endpoint}")
+        endpoint = _EP_ISSUE_COMMENT % issue_id_or_key
+        logger.debug(
+            "Adding comment to issue %s with v3 API endpoint: %s",
+            issue_id_or_key,
+            endpoint,
+        )
         response_data = await self._make_v3_api_request("POST", endpoint, data=payload)
-        logger.debug(f"Add comment API response: {json.dumps(response_data, indent=2)}")
+        _log_json("Add comment API response", response_data)
         return response_data
 
     async def create_issue(
@@ -516,12 +1167,12 @@ class JiraV3APIClient:
         if transition:
             payload["transition"] = transition
 
-        endpoint = "/issue"
-        logger.debug(f"Creating issue with v3 API endpoint: {endpoint}")
-        logger.debug(f"Create issue payload: {json.dumps(payload, indent=2)}")
+        endpoint = _EP_ISSUE
+        logger.debug("Creating issue with v3 API endpoint: %s", endpoint)
+        _log_json("Create issue payload", payload)
 
         response_data = await self._make_v3_api_request("POST", endpoint, data=payload)
-        logger.debug(f"Create issue response: {response_data}")
+        logger.debug("Create issue response: %s", response_data)
         return response_data
 
     async def search_issues(
@@ -569,37 +1220,59 @@ class JiraV3APIClient:
         if not jql:
             raise ValueError("jql parameter is required")
 
-        # Build query parameters
-        params = {
-            "jql": jql,
-            "startAt": start_at,
-            "maxResults": max_results,
-        }
-
-        # Add optional parameters if provided
-        params["fields"] = fields if fields is not None else "*all"
-        if expand:
-            params["expand"] = expand
-        if properties:
-            params["properties"] = properties
-        if fields_by_keys is not None:
-            params["fieldsByKeys"] = fields_by_keys
-        if fail_fast is not None:
-            params["failFast"] = fail_fast
-        if reconcile_issues:
-            params["reconcileIssues"] = reconcile_issues
-
-        # Remove None values
-        params = {k: v for k, v in params.items() if v is not None}
-
-        endpoint = "/search/jql"
-        logger.debug(f"Searching issues with v3 API endpoint: {endpoint}")
-        logger.debug(f"Search params: {params}")
+        # Build query parameters, leaving out the ones that weren't provided
+        params = _compact(
+            ("jql", jql),
+            ("startAt", start_at),
+            ("maxResults", max_results),
+            ("fields", fields if fields is not None else "*all"),
+            ("expand", expand or None),
+            ("properties", properties or None),
+            ("fieldsByKeys", fields_by_keys),
+            ("failFast", fail_fast),
+            ("reconcileIssues", reconcile_issues or None),
+        )
+
+        endpoint = _EP_SEARCH
+        logger.debug("Searching issues with v3 API endpoint: %s", endpoint)
+        logger.debug("Search params: %s", params)
         
         response_data = await self._make_v3_api_request("GET", endpoint, params=params)
-        logger.debug(f"Search issues API response: {json.dumps(response_data, indent=2)}")
+        _log_json("Search issues API response", response_data)
         return response_data
 
+    def iter_search_issues(
+        self,
+        jql: str,
+        page_size: int = 50,
+        prefetch: int = 2,
+        **search_args: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over every issue matching a JQL query, prefetching pages.
+
+        Args:
+            jql: JQL query string
+            page_size: Number of issues to request per page (default: 50)
+            prefetch: Number of pages requested together (default: 2)
+            **search_args: Additional `search_issues` arguments (e.g. fields)
+
+        Returns:
+            Async iterator of issue dictionaries, in search order
+
+        Raises:
+            ValueError: If jql is empty or any page request fails
+        """
+        if not jql:
+            raise ValueError("jql parameter is required")
+
+        async def _fetch(start_at: int, max_results: int) -> Dict[str, Any]:
+            return await self.search_issues(
+                jql, start_at=start_at, max_results=max_results, **search_args
+            )
+
+        return self._iter_pages(_fetch, "issues", page_size, prefetch)
+
     async def bulk_create_issues(
         self, 
         issue_updates: list
@@ -627,17 +1300,93 @@ class JiraV3APIClient:
         if not issue_updates:
             raise ValueError("issue_updates list cannot be empty")
 
-        if len(issue_updates) > 50:
-            raise ValueError("Cannot create more than 50 issues in a single bulk operation")
+        if len(issue_updates) > BULK_CREATE_LIMIT:
+            raise ValueError(
+                f"Cannot create more than {BULK_CREATE_LIMIT} issues in a single "
+                "bulk operation"
+            )
 
         # Build the request payload for v3 API
         payload = {"issueUpdates": issue_updates}
 
-        endpoint = "/issue/bulk"
-        logger.debug(f"Bulk creating issues with v3 API endpoint: {endpoint}")
-        logger.debug(f"Payload: {json.dumps(payload, indent=2)}")
+        endpoint = _EP_ISSUE_BULK
+        logger.debug("Bulk creating issues with v3 API endpoint: %s", endpoint)
+        _log_json("Payload", payload)
 
         response_data = await self._make_v3_api_request("POST", endpoint, data=payload)
-        logger.debug(f"Bulk create response: {json.dumps(response_data, indent=2)}")
+        _log_json("Bulk create response", response_data)
 
         return response_data
+
+    async def bulk_create_issues_many(
+        self,
+        issue_updates: List[Dict[str, Any]],
+        concurrency: int = BULK_CREATE_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        """
+        Bulk create any number of issues using the v3 REST API.
+
+        The issues are split into chunks of up to 50 and the chunks are sent
+        concurrently (at most `concurrency` at a time). The per-chunk responses
+        are merged into one response in the shape of `bulk_create_issues`, with
+        each error's failedElementNumber pointing into `issue_updates`. A chunk
+        whose request fails outright reports one error per issue in it.
+
+        Args:
+            issue_updates: List of issue creation specifications, as for
+                          `bulk_create_issues`
+            concurrency: Maximum number of chunk requests in flight
+
+        Returns:
+            Dict containing:
+            - issues: Created issues, in chunk order
+            - errors: Errors for failed issue creations
+
+        Raises:
+            ValueError: If issue_updates is empty or concurrency is below 1
+        """
+        if not issue_updates:
+            raise ValueError("issue_updates list cannot be empty")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        offsets = range(0, len(issue_updates), BULK_CREATE_LIMIT)
+
+        async def _create(offset: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.bulk_create_issues(
+                    issue_updates[offset : offset + BULK_CREATE_LIMIT]
+                )
+
+        responses = await asyncio.gather(
+            *(_create(offset) for offset in offsets), return_exceptions=True
+        )
+
+        issues: List[Any] = []
+        errors: List[Any] = []
+        for offset, response in zip(offsets, responses):
+            if isinstance(response, BaseException):
+                if not isinstance(response, Exception):
+                    raise response
+                size = min(BULK_CREATE_LIMIT, len(issue_updates) - offset)
+                errors.extend(
+                    {
+                        "failedElementNumber": offset + index,
+                        "elementErrors": {"errorMessages": [str(response)]},
+                    }
+                    for index in range(size)
+                )
+                continue
+            issues.extend(response.get("issues", []))
+            for error in response.get("errors", []):
+                if isinstance(error, dict) and isinstance(
+                    error.get("failedElementNumber"), int
+                ):
+                    error = {
+                        **error,
+                        "failedElementNumber": offset + error["failedElementNumber"],
+                    }
+                errors.append(error)
+
+        return {"issues": issues, "errors": errors}
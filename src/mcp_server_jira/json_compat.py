@@ -0,0 +1,48 @@
+"""
+JSON helpers for the Jira MCP server.
+
+orjson is used when it is installed; otherwise the stdlib json module is used
+with the same bytes-in/bytes-out behaviour.
+"""
+
+import json
+from typing import Any, Union
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+
+    def dumps(value: Any) -> bytes:
+        """Serialize a value to compact UTF-8 JSON"""
+        return orjson.dumps(value)
+
+    def dumps_pretty(value: Any) -> str:
+        """Serialize a value to JSON indented by two spaces"""
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str"""
+        return orjson.loads(data)
+
+else:
+
+    def dumps(value: Any) -> bytes:
+        """Serialize a value to compact UTF-8 JSON"""
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+    def dumps_pretty(value: Any) -> str:
+        """Serialize a value to JSON indented by two spaces"""
+        return json.dumps(value, indent=2, ensure_ascii=False)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str"""
+        return json.loads(data)
@@ -1,11 +1,18 @@
 import asyncio
-import json
+import atexit
+import difflib
+import functools
 import logging
 import os
+import queue
+import re
 import sys
+import time
+from collections import OrderedDict
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 # --- Setup a dedicated file logger ---
 log_file_path = Path(__file__).parent / "jira_mcp_debug.log"
@@ -23,36 +30,154 @@ formatter = logging.Formatter(
 )
 handler.setFormatter(formatter)
 
+# Route records through a queue so the file writes happen on a listener
+# thread instead of blocking the event loop
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+
 # Add the handler to the logger
 if not logger.handlers:
-    logger.addHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+    log_listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(log_listener.stop)
 
 logger.info("Logger initialized. All subsequent logs will go to jira_mcp_debug.log")
 # --- End of logger setup ---
 
-try:
-    from jira import JIRA
-except ImportError:
-    from .jira import JIRA
-
 from pydantic import BaseModel
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import EmbeddedResource, ImageContent, TextContent, Tool
 
-from .jira_v3_api import JiraV3APIClient
+from . import json_compat
+from .jira_v3_api import BULK_CREATE_LIMIT, JiraV3APIClient, adf_document
+
+# Fields get_jira_issue reports on their own rather than in its fields dict
+_ISSUE_BUILTIN_FIELDS = frozenset(
+    {
+        "comment",
+        "attachment",
+        "summary",
+        "description",
+        "status",
+        "assignee",
+        "reporter",
+        "created",
+        "updated",
+    }
+)
+
+# Properly cased names of Jira's standard issue types, keyed by lower case
+_STANDARD_ISSUE_TYPES = {
+    "bug": "Bug",
+    "task": "Task",
+    "story": "Story",
+    "epic": "Epic",
+    "improvement": "Improvement",
+    "newfeature": "New Feature",
+    "new feature": "New Feature",
+}
+# Issue keys the create tools handle themselves before copying extra fields
+_PROCESSED_ISSUE_KEYS = frozenset(
+    {"project", "summary", "description", "issuetype", "issue_type"}
+)
+
+
+def _normalize_assignees(value: Any) -> Any:
+    """Convert a single assignee name into a list"""
+    if isinstance(value, str):
+        return [value] if value else []
+    return value
+
+
+def _normalize_assignee(value: Any) -> Any:
+    """Convert an assignee name, or a list holding one, into a name object"""
+    if isinstance(value, str):
+        return {"name": value} if value else None
+    if isinstance(value, list) and value:
+        return {"name": value[0]}
+    return value
+
+
+def _normalize_labels(value: Any) -> Any:
+    """Convert a single label into a list"""
+    if isinstance(value, str):
+        return [value] if value else []
+    return value
+
+
+def _normalize_milestone(value: Any) -> Any:
+    """Convert a numeric milestone string into a number"""
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return value
+
+
+# Extra issue fields whose values are converted to the format Jira expects
+_FIELD_NORMALIZERS: Dict[str, Callable[[Any], Any]] = {
+    "assignees": _normalize_assignees,
+    "assignee": _normalize_assignee,
+    "labels": _normalize_labels,
+    "milestone": _normalize_milestone,
+}
 
-try:
-    from dotenv import load_dotenv
+# Seconds the jira library client waits on each request
+JIRA_TIMEOUT = 10
 
-    # Try to load from .env file if it exists
-    env_path = Path(__file__).parent.parent.parent.parent / ".env"
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path)
-except ImportError:
-    # dotenv is optional
-    pass
+# Maximum number of issues kept by get_jira_issue, and how many seconds a
+# cached issue is served before it is fetched again
+ISSUE_CACHE_SIZE = 256
+ISSUE_CACHE_TTL = 60.0
+
+
+# Characters ignored when comparing issue type names, e.g. "new-feature"
+_TYPE_NAME_NOISE = re.compile(r"[^a-z0-9]")
+
+
+def _normalize_type_name(name: str) -> str:
+    """Case-fold an issue type name and drop spaces and punctuation"""
+    return _TYPE_NAME_NOISE.sub("", name.casefold())
+
+
+def _closest_issue_type(attempted: str, type_names: List[str]) -> Optional[str]:
+    """Suggest the available issue type closest to a rejected one
+
+    Names are compared case-folded without spaces or punctuation. An equal
+    name wins, then one containing (or contained in) the attempted name;
+    otherwise the best fuzzy match is used, so typos like 'Tsk' still get a
+    suggestion.
+    """
+    attempted_norm = _normalize_type_name(attempted)
+    if not attempted_norm:
+        return None
+    by_norm: Dict[str, str] = {}
+    for name in type_names:
+        by_norm.setdefault(_normalize_type_name(name), name)
+    by_norm.pop("", None)
+
+    if attempted_norm in by_norm:
+        return by_norm[attempted_norm]
+    for name_norm, name in by_norm.items():
+        if attempted_norm in name_norm or name_norm in attempted_norm:
+            return name
+    matches = difflib.get_close_matches(attempted_norm, by_norm, n=1, cutoff=0.6)
+    return by_norm[matches[0]] if matches else None
+
+
+@functools.cache
+def _jira_class() -> type:
+    """Import the jira library on first use.
+
+    Only the legacy ``get_jira_issue`` path needs it, so deferring the import
+    keeps it (and its requests/urllib3 dependency tree) off the startup path.
+    """
+    try:
+        from jira import JIRA
+    except ImportError:
+        from .jira import JIRA
+    return JIRA
 
 
 class JiraTools(str, Enum):
@@ -120,204 +245,144 @@ class JiraServer:
         self.password = password
         self.token = token
 
-        self._v3_api_client = JiraV3APIClient(
-            server_url=self.server_url,
-            username=self.username,
-            token=self.token,
-            password=password,
-        )
+        # Created on first use so that serve() can complete the MCP handshake
+        # before any Jira client setup (or credential validation) happens
+        self._v3_client: Optional[JiraV3APIClient] = None
         self.client = None
+        # LRU cache of (fetch time, result) from get_jira_issue, keyed by
+        # issue key
+        self._issue_cache: "OrderedDict[str, Tuple[float, JiraIssueResult]]" = (
+            OrderedDict()
+        )
+
+    def connect(self) -> bool:
+        """Connect to Jira server using provided authentication details
 
-    def connect(self):
-        """Connect to Jira server using provided authentication details"""
+        The credentials decide a single auth method up front, so a bad
+        configuration fails after one round trip rather than after every
+        fallback in turn.
+        """
         if not self.server_url:
-            print("Error: Jira server URL not provided")
+            logger.error("Jira server URL not provided")
             return False
 
-        error_messages = []
+        JIRA = _jira_class()
+
+        # Match the v3 client: prefer the API token over a password, since
+        # Jira Cloud rejects passwords for basic auth
+        secret = self.token or self.password
+        auth_kwargs: Dict[str, Any]
+        if self.auth_method == "token_auth" and self.token:
+            auth_name, auth_kwargs = "token_auth", {"token_auth": self.token}
+        elif self.username and secret:
+            auth_name = "basic_auth"
+            auth_kwargs = {"basic_auth": (self.username, secret)}
+        elif self.token:
+            auth_name, auth_kwargs = "token_auth", {"token_auth": self.token}
+        else:
+            auth_name, auth_kwargs = "anonymous access", {}
 
-        # Try multiple auth methods if possible
         try:
-            # First, try the specified auth method
-            if self.auth_method == "basic_auth":
-                # Basic auth - either username/password or username/token
-                if self.username and self.password:
-                    try:
-                        print(f"Trying basic_auth with username and password")
-                        self.client = JIRA(
-                            server=self.server_url,
-                            basic_auth=(self.username, self.password),
-                        )
-                        print("Connection successful with username/password")
-                        return True
-                    except Exception as e:
-                        error_msg = f"Failed basic_auth with username/password: {type(e).__name__}: {str(e)}"
-                        print(error_msg)
-                        error_messages.append(error_msg)
-
-                if self.username and self.token:
-                    try:
-                        print(f"Trying basic_auth with username and API token")
-                        self.client = JIRA(
-                            server=self.server_url,
-                            basic_auth=(self.username, self.token),
-                        )
-                        print("Connection successful with username/token")
-                        return True
-                    except Exception as e:
-                        error_msg = f"Failed basic_auth with username/token: {type(e).__name__}: {str(e)}"
-                        print(error_msg)
-                        error_messages.append(error_msg)
-
-                print("Error: Username and password/token required for basic auth")
-                error_messages.append(
-                    "Username and password/token required for basic auth"
-                )
-
-            elif self.auth_method == "token_auth":
-                # Token auth - just need the token
-                if self.token:
-                    try:
-                        print(f"Trying token_auth with token")
-                        self.client = JIRA(
-                            server=self.server_url, token_auth=self.token
-                        )
-                        print("Connection successful with token_auth")
-                        return True
-                    except Exception as e:
-                        error_msg = f"Failed token_auth: {type(e).__name__}: {str(e)}"
-                        print(error_msg)
-                        error_messages.append(error_msg)
-                else:
-                    print("Error: Token required for token auth")
-                    error_messages.append("Token required for token auth")
-
-            # If we're here and have a token, try using it with basic_auth for Jira Cloud
-            # (even if auth_method wasn't basic_auth)
-            if self.token and self.username and not self.client:
-                try:
-                    print(f"Trying fallback to basic_auth with username and token")
-                    self.client = JIRA(
-                        server=self.server_url, basic_auth=(self.username, self.token)
-                    )
-                    print("Connection successful with fallback basic_auth")
-                    return True
-                except Exception as e:
-                    error_msg = (
-                        f"Failed fallback to basic_auth: {type(e).__name__}: {str(e)}"
-                    )
-                    print(error_msg)
-                    error_messages.append(error_msg)
-
-            # If we're here and have a token, try using token_auth as a fallback
-            # (even if auth_method wasn't token_auth)
-            if self.token and not self.client:
-                try:
-                    print(f"Trying fallback to token_auth")
-                    self.client = JIRA(server=self.server_url, token_auth=self.token)
-                    print("Connection successful with fallback token_auth")
-                    return True
-                except Exception as e:
-                    error_msg = (
-                        f"Failed fallback to token_auth: {type(e).__name__}: {str(e)}"
-                    )
-                    print(error_msg)
-                    error_messages.append(error_msg)
-
-            # Last resort: try anonymous access
-            try:
-                print(f"Trying anonymous access as last resort")
-                self.client = JIRA(server=self.server_url)
-                print("Connection successful with anonymous access")
-                return True
-            except Exception as e:
-                error_msg = f"Failed anonymous access: {type(e).__name__}: {str(e)}"
-                print(error_msg)
-                error_messages.append(error_msg)
-
-            # If we got here, all connection attempts failed
-            print(f"All connection attempts failed: {', '.join(error_messages)}")
-            return False
-
+            logger.debug("Trying %s", auth_name)
+            self.client = JIRA(
+                server=self.server_url, timeout=JIRA_TIMEOUT, **auth_kwargs
+            )
         except Exception as e:
-            error_msg = f"Unexpected error in connect(): {type(e).__name__}: {str(e)}"
-            print(error_msg)
-            error_messages.append(error_msg)
+            logger.error(
+                "Failed %s: %s: %s", auth_name, type(e).__name__, e, exc_info=True
+            )
             return False
 
+        logger.info("Connection successful with %s", auth_name)
+        return True
+
     def _get_v3_api_client(self) -> JiraV3APIClient:
         """Get or create a v3 API client instance"""
-        if not self._v3_api_client:
-            self._v3_api_client = JiraV3APIClient(
+        if not self._v3_client:
+            # Fail fast with a configuration hint before building any client
+            if not self.server_url:
+                raise ValueError(
+                    "Jira server URL is not configured. Set JIRA_SERVER_URL."
+                )
+            if not self.username or not (self.token or self.password):
+                raise ValueError(
+                    "Jira credentials are not configured. Set JIRA_USERNAME and "
+                    "JIRA_TOKEN (or JIRA_PASSWORD)."
+                )
+            self._v3_client = JiraV3APIClient(
                 server_url=self.server_url,
                 username=self.username,
                 password=self.password,
                 token=self.token,
             )
-        return self._v3_api_client
+        return self._v3_client
+
+    async def aclose(self) -> None:
+        """Close the v3 API client if one has been created"""
+        if self._v3_client is not None:
+            await self._v3_client.aclose()
+            self._v3_client = None
 
     async def get_jira_projects(self) -> List[JiraProjectResult]:
         """Get all accessible Jira projects using v3 REST API"""
         logger.info("Starting get_jira_projects...")
-        all_projects_data = []
-        start_at = 0
-        max_results = 50
-        page_count = 0
-
-        while True:
-            page_count += 1
-            logger.info(
-                f"Pagination loop, page {page_count}: startAt={start_at}, maxResults={max_results}"
-            )
-
-            try:
-                response = await self._v3_api_client.get_projects(
-                    start_at=start_at, max_results=max_results
-                )
-
-                projects = response.get("values", [])
-                if not projects:
-                    logger.info("No more projects returned. Breaking pagination loop.")
-                    break
-
-                all_projects_data.extend(projects)
-
-                if response.get("isLast", False):
-                    logger.info("'isLast' is True. Breaking pagination loop.")
-                    break
-
-                start_at += len(projects)
-
-                # Yield control to the event loop to prevent deadlocks in the MCP framework.
-                await asyncio.sleep(0)
-
-            except Exception as e:
-                logger.error(
-                    "Error inside get_jira_projects pagination loop", exc_info=True
-                )
-                raise
+        try:
+            all_projects_data = await self._get_v3_api_client().get_all_projects()
+        except Exception:
+            logger.error("Error fetching projects in get_jira_projects", exc_info=True)
+            raise
 
         logger.info(
-            f"Finished get_jira_projects. Total projects found: {len(all_projects_data)}"
+            "Finished get_jira_projects. Total projects found: %s",
+            len(all_projects_data),
         )
 
+        # Jira's own response needs no validation, so skip pydantic's per-field
+        # checks for what can be a long list
         results = []
         for p in all_projects_data:
             results.append(
-                JiraProjectResult(
+                JiraProjectResult.model_construct(
                     key=p.get("key"),
                     name=p.get("name"),
                     id=str(p.get("id")),
                     lead=(p.get("lead") or {}).get("displayName"),
                 )
             )
-            logger.info(f"Added project {p.get('key')} to results")
-        logger.info(f"Returning {len(results)} projects")
+            logger.info("Added project %s to results", p.get("key"))
+        logger.info("Returning %s projects", len(results))
         sys.stdout.flush()  # Flush stdout to ensure it's sent to MCP, otherwise hang occurs
         return results
 
+    def invalidate_issue_cache(self, issue_key: Optional[str] = None) -> None:
+        """Drop one cached issue, or every cached issue if no key is given"""
+        if issue_key is None:
+            self._issue_cache.clear()
+        else:
+            self._issue_cache.pop(issue_key, None)
+
     def get_jira_issue(self, issue_key: str) -> JiraIssueResult:
-        """Get details for a specific issue by key"""
+        """Get details for a specific issue by key
+
+        Results are reused for up to ISSUE_CACHE_TTL seconds; comments and
+        transitions made through this server drop the issue from the cache.
+        """
+        now = time.monotonic()
+        cached = self._issue_cache.get(issue_key)
+        if cached is not None and now - cached[0] < ISSUE_CACHE_TTL:
+            self._issue_cache.move_to_end(issue_key)
+            logger.debug("Using cached issue %s", issue_key)
+            return cached[1].model_copy(deep=True)
+
+        result = self._fetch_jira_issue(issue_key)
+        self._issue_cache[issue_key] = (now, result)
+        self._issue_cache.move_to_end(issue_key)
+        if len(self._issue_cache) > ISSUE_CACHE_SIZE:
+            self._issue_cache.popitem(last=False)
+        return result.model_copy(deep=True)
+
+    def _fetch_jira_issue(self, issue_key: str) -> JiraIssueResult:
+        """Fetch a specific issue by key with the jira library"""
         if not self.client:
             if not self.connect():
                 # Connection failed - provide clear error message
@@ -327,96 +392,76 @@ class JiraServer:
 
         try:
             issue = self.client.issue(issue_key)
+            # Read everything from the raw JSON with dict lookups rather than
+            # probing the resource object's attributes with hasattr/getattr
+            raw_fields = issue.raw.get("fields", {})
 
             # Extract comments if available
             comments = []
-            if hasattr(issue.fields, "comment") and hasattr(
-                issue.fields.comment, "comments"
-            ):
-                for comment in issue.fields.comment.comments:
-                    comments.append(
-                        {
-                            "author": (
-                                getattr(
-                                    comment.author, "displayName", str(comment.author)
-                                )
-                                if hasattr(comment, "author")
-                                else "Unknown"
-                            ),
-                            "body": comment.body,
-                            "created": comment.created,
-                        }
-                    )
+            for comment in (raw_fields.get("comment") or {}).get("comments", []):
+                author = comment.get("author")
+                comments.append(
+                    {
+                        "author": (
+                            author.get("displayName", str(author))
+                            if author is not None
+                            else "Unknown"
+                        ),
+                        "body": comment.get("body"),
+                        "created": comment.get("created"),
+                    }
+                )
 
             # Create a fields dictionary with custom fields
             fields = {}
-            for field_name in dir(issue.fields):
-                if not field_name.startswith("_") and field_name not in [
-                    "comment",
-                    "attachment",
-                    "summary",
-                    "description",
-                    "status",
-                    "assignee",
-                    "reporter",
-                    "created",
-                    "updated",
-                ]:
-                    value = getattr(issue.fields, field_name)
-                    if value is not None:
-                        # Handle special field types
-                        if hasattr(value, "name"):
-                            fields[field_name] = value.name
-                        elif hasattr(value, "value"):
-                            fields[field_name] = value.value
-                        elif isinstance(value, list):
-                            if len(value) > 0:
-                                if hasattr(value[0], "name"):
-                                    fields[field_name] = [item.name for item in value]
-                                else:
-                                    fields[field_name] = value
+            for field_name, value in raw_fields.items():
+                if value is None or field_name in _ISSUE_BUILTIN_FIELDS:
+                    continue
+                # Handle special field types
+                if isinstance(value, dict):
+                    if "name" in value:
+                        fields[field_name] = value["name"]
+                    elif "value" in value:
+                        fields[field_name] = value["value"]
+                    else:
+                        fields[field_name] = str(value)
+                elif isinstance(value, list):
+                    if len(value) > 0:
+                        if isinstance(value[0], dict) and "name" in value[0]:
+                            fields[field_name] = [item.get("name") for item in value]
                         else:
-                            fields[field_name] = str(value)
+                            fields[field_name] = value
+                else:
+                    fields[field_name] = str(value)
 
             return JiraIssueResult(
                 key=issue.key,
-                summary=issue.fields.summary,
-                description=issue.fields.description,
-                status=(
-                    issue.fields.status.name
-                    if hasattr(issue.fields, "status")
-                    else None
-                ),
-                assignee=(
-                    issue.fields.assignee.displayName
-                    if hasattr(issue.fields, "assignee") and issue.fields.assignee
-                    else None
-                ),
-                reporter=(
-                    issue.fields.reporter.displayName
-                    if hasattr(issue.fields, "reporter") and issue.fields.reporter
-                    else None
-                ),
-                created=(
-                    issue.fields.created if hasattr(issue.fields, "created") else None
-                ),
-                updated=(
-                    issue.fields.updated if hasattr(issue.fields, "updated") else None
-                ),
+                summary=raw_fields.get("summary"),
+                description=raw_fields.get("description"),
+                status=(raw_fields.get("status") or {}).get("name"),
+                assignee=(raw_fields.get("assignee") or {}).get("displayName"),
+                reporter=(raw_fields.get("reporter") or {}).get("displayName"),
+                created=raw_fields.get("created"),
+                updated=raw_fields.get("updated"),
                 fields=fields,
                 comments=comments,
             )
         except Exception as e:
-            print(f"Failed to get issue {issue_key}: {type(e).__name__}: {str(e)}")
-            raise ValueError(
-                f"Failed to get issue {issue_key}: {type(e).__name__}: {str(e)}"
-            )
+            error_msg = f"Failed to get issue {issue_key}: {type(e).__name__}: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            raise ValueError(error_msg)
 
     async def search_jira_issues(
-        self, jql: str, max_results: int = 10
+        self, jql: str, max_results: int = 10, fields: Optional[str] = None
     ) -> List[JiraIssueResult]:
-        """Search for issues using JQL via v3 REST API with pagination support"""
+        """Search for issues using JQL via v3 REST API with pagination support
+
+        `fields` is a comma-separated list of fields to return; leaving it out
+        returns every field, which can be large on instances with many custom
+        fields.
+        """
         logger.info("Starting search_jira_issues...")
+        search_args = {"fields": fields} if fields else {}
 
         try:
             # Use v3 API client
@@ -428,24 +473,36 @@ class JiraServer:
             page_size = min(max_results, 100)  # Jira typically limits to 100 per page
             
             while True:
-                logger.debug(f"Fetching page starting at {start_at} with page size {page_size}")
+                logger.debug(
+                    "Fetching page starting at %s with page size %s",
+                    start_at,
+                    page_size,
+                )
                 response_data = await v3_client.search_issues(
                     jql=jql, 
                     start_at=start_at,
-                    max_results=page_size
+                    max_results=page_size,
+                    **search_args,
                 )
 
                 # Extract issues from current page
                 page_issues = response_data.get("issues", [])
                 all_issues.extend(page_issues)
                 
-                logger.debug(f"Retrieved {len(page_issues)} issues from current page. Total so far: {len(all_issues)}")
+                logger.debug(
+                    "Retrieved %s issues from current page. Total so far: %s",
+                    len(page_issues),
+                    len(all_issues),
+                )
 
                 # Check if we've reached the user's max_results limit
                 if len(all_issues) >= max_results:
                     # Trim to exact max_results if we exceeded it
                     all_issues = all_issues[:max_results]
-                    logger.debug(f"Reached max_results limit of {max_results}, stopping pagination")
+                    logger.debug(
+                        "Reached max_results limit of %s, stopping pagination",
+                        max_results,
+                    )
                     break
 
                 # Check if this is the last page according to API
@@ -454,6 +511,35 @@ class JiraServer:
                     logger.debug("API indicates this is the last page, stopping pagination")
                     break
 
+                # Once Jira reports the total and honours the page size, the
+                # remaining offsets are known, so request those pages together
+                total = response_data.get("total")
+                if (
+                    start_at == 0
+                    and total is not None
+                    and len(page_issues) == page_size
+                ):
+                    target = min(total, max_results)
+                    logger.debug(
+                        "Fetching remaining %s issues concurrently",
+                        target - len(all_issues),
+                    )
+                    pages = await asyncio.gather(
+                        *(
+                            v3_client.search_issues(
+                                jql=jql,
+                                start_at=offset,
+                                max_results=min(page_size, target - offset),
+                                **search_args,
+                            )
+                            for offset in range(page_size, target, page_size)
+                        )
+                    )
+                    for page in pages:
+                        all_issues.extend(page.get("issues", []))
+                    all_issues = all_issues[:max_results]
+                    break
+
                 # If we have more pages, prepare for next iteration
                 start_at = len(all_issues)  # Use actual number of issues retrieved so far
                 
@@ -462,14 +548,13 @@ class JiraServer:
                 page_size = min(remaining_needed, 100)
 
             # Return raw issues list for full JSON data
-            logger.info(f"Returning raw issues ({len(all_issues)}) for JQL: {jql}")
+            logger.info("Returning raw issues (%s) for JQL: %s", len(all_issues), jql)
             return all_issues
 
 
         except Exception as e:
             error_msg = f"Failed to search issues: {type(e).__name__}: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            print(error_msg)
             raise ValueError(error_msg)
 
     async def create_jira_issue(
@@ -537,33 +622,19 @@ class JiraServer:
 
             # Issue type - required, with validation for common issue types
             logger.info(
-                f"Processing issue_type: '{issue_type}' (type: {type(issue_type)})"
+                "Processing issue_type: '%s' (type: %s)",
+                issue_type,
+                type(issue_type),
             )
-            common_types = [
-                "bug",
-                "task",
-                "story",
-                "epic",
-                "improvement",
-                "newfeature",
-                "new feature",
-            ]
-
             if isinstance(issue_type, str):
                 # Check for common issue type variants and fix case-sensitivity issues
-                issue_type_lower = issue_type.lower()
-
-                if issue_type_lower in common_types:
-                    # Convert first letter to uppercase for standard Jira types
-                    issue_type_proper = issue_type_lower.capitalize()
-                    if (
-                        issue_type_lower == "new feature"
-                        or issue_type_lower == "newfeature"
-                    ):
-                        issue_type_proper = "New Feature"
+                issue_type_proper = _STANDARD_ISSUE_TYPES.get(issue_type.lower())
 
+                if issue_type_proper is not None:
                     logger.info(
-                        f"Note: Converting issue type from '{issue_type}' to '{issue_type_proper}'"
+                        "Note: Converting issue type from '%s' to '%s'",
+                        issue_type,
+                        issue_type_proper,
                     )
                     issue_dict["issuetype"] = {"name": issue_type_proper}
                 else:
@@ -576,42 +647,12 @@ class JiraServer:
             if fields:
                 for key, value in fields.items():
                     # Skip fields we've already processed
-                    if key in [
-                        "project",
-                        "summary",
-                        "description",
-                        "issuetype",
-                        "issue_type",
-                    ]:
+                    if key in _PROCESSED_ISSUE_KEYS:
                         continue
 
                     # Handle special fields that require specific formats
-                    if key == "assignees" or key == "assignee":
-                        # Convert string to array for assignees or proper format for assignee
-                        if isinstance(value, str):
-                            if key == "assignees":
-                                issue_dict[key] = [value] if value else []
-                            else:  # assignee
-                                issue_dict[key] = {"name": value} if value else None
-                        elif isinstance(value, list) and key == "assignee" and value:
-                            # If assignee is a list but should be a dict with name
-                            issue_dict[key] = {"name": value[0]}
-                        else:
-                            issue_dict[key] = value
-                    elif key == "labels":
-                        # Convert string to array for labels
-                        if isinstance(value, str):
-                            issue_dict[key] = [value] if value else []
-                        else:
-                            issue_dict[key] = value
-                    elif key == "milestone":
-                        # Convert string to number for milestone
-                        if isinstance(value, str) and value.isdigit():
-                            issue_dict[key] = int(value)
-                        else:
-                            issue_dict[key] = value
-                    else:
-                        issue_dict[key] = value
+                    normalize = _FIELD_NORMALIZERS.get(key)
+                    issue_dict[key] = normalize(value) if normalize else value
 
             # Use v3 API client
             v3_client = self._get_v3_api_client()
@@ -621,7 +662,7 @@ class JiraServer:
             issue_key = response_data.get("key")
             issue_id = response_data.get("id")
 
-            logger.info(f"Successfully created issue {issue_key} (ID: {issue_id})")
+            logger.info("Successfully created issue %s (ID: %s)", issue_key, issue_id)
 
             # Return JiraIssueResult with the created issue details
             # For v3 API, we return what we have from the create response
@@ -651,24 +692,20 @@ class JiraServer:
                         )
                         type_names = [t.get("name") for t in issue_types]
                         logger.info(
-                            f"Available issue types for project {project_key}: {', '.join(type_names)}"
+                            "Available issue types for project %s: %s",
+                            project_key,
+                            ", ".join(type_names),
                         )
 
                         # Try to find the closest match
                         attempted_type = issue_type
-                        closest = None
-                        attempted_lower = attempted_type.lower()
-                        for t in type_names:
-                            if (
-                                attempted_lower in t.lower()
-                                or t.lower() in attempted_lower
-                            ):
-                                closest = t
-                                break
+                        closest = _closest_issue_type(attempted_type, type_names)
 
                         if closest:
                             logger.info(
-                                f"The closest match to '{attempted_type}' is '{closest}'"
+                                "The closest match to '%s' is '%s'",
+                                attempted_type,
+                                closest,
                             )
                             error_msg += f" Available types: {', '.join(type_names)}. Closest match: '{closest}'"
                         else:
@@ -699,8 +736,9 @@ class JiraServer:
                 ),
             )
         except Exception as e:
-            print(f"Failed to create issue: {type(e).__name__}: {str(e)}")
-            raise ValueError(f"Failed to create issue: {type(e).__name__}: {str(e)}")
+            error_msg = f"Failed to create issue: {type(e).__name__}: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            raise ValueError(error_msg)
 
     async def create_jira_issues(
         self, field_list: List[Dict[str, Any]], prefetch: bool = True
@@ -741,16 +779,31 @@ class JiraServer:
         logger.info("Starting create_jira_issues...")
 
         try:
+            # Validate every issue up front, so a bad entry late in a long list
+            # fails before any payload is built
+            for number, fields in enumerate(field_list, start=1):
+                if "project" not in fields:
+                    raise ValueError(
+                        f"Each issue must have a 'project' field (issue {number})"
+                    )
+                if "summary" not in fields:
+                    raise ValueError(
+                        f"Each issue must have a 'summary' field (issue {number})"
+                    )
+                if "issuetype" not in fields and "issue_type" not in fields:
+                    raise ValueError(
+                        "Each issue must have an 'issuetype' or 'issue_type' field "
+                        f"(issue {number})"
+                    )
+
             # Process each field dict to ensure proper formatting for v3 API
             processed_field_list = []
             for fields in field_list:
                 # Create a properly formatted issue dictionary
                 issue_dict = {}
 
-                # Process required fields first to ensure they exist
+                # Process required fields first
                 # Project field - required
-                if "project" not in fields:
-                    raise ValueError("Each issue must have a 'project' field")
                 project_value = fields["project"]
                 if isinstance(project_value, str):
                     issue_dict["project"] = {"key": project_value}
@@ -758,8 +811,6 @@ class JiraServer:
                     issue_dict["project"] = project_value
 
                 # Summary field - required
-                if "summary" not in fields:
-                    raise ValueError("Each issue must have a 'summary' field")
                 issue_dict["summary"] = fields["summary"]
 
                 # Description field - convert to ADF format for v3 API if it's a simple string
@@ -767,64 +818,31 @@ class JiraServer:
                     description = fields["description"]
                     if isinstance(description, str):
                         # Convert simple string to Atlassian Document Format
-                        issue_dict["description"] = {
-                            "type": "doc",
-                            "version": 1,
-                            "content": [
-                                {
-                                    "type": "paragraph",
-                                    "content": [
-                                        {
-                                            "type": "text",
-                                            "text": description
-                                        }
-                                    ]
-                                }
-                            ]
-                        }
+                        issue_dict["description"] = adf_document(description)
                     else:
                         # Assume it's already in ADF format
                         issue_dict["description"] = description
 
                 # Issue type field - required, handle both 'issuetype' and 'issue_type'
-                issue_type = None
                 if "issuetype" in fields:
                     issue_type = fields["issuetype"]
-                elif "issue_type" in fields:
-                    issue_type = fields["issue_type"]
                 else:
-                    raise ValueError(
-                        "Each issue must have an 'issuetype' or 'issue_type' field"
-                    )
+                    issue_type = fields["issue_type"]
 
                 # Check for common issue type variants and fix case-sensitivity issues
                 logger.debug(
-                    f"Processing bulk issue_type: '{issue_type}' (type: {type(issue_type)})"
+                    "Processing bulk issue_type: '%s' (type: %s)",
+                    issue_type,
+                    type(issue_type),
                 )
-                common_types = [
-                    "bug",
-                    "task",
-                    "story",
-                    "epic",
-                    "improvement",
-                    "newfeature",
-                    "new feature",
-                ]
-
                 if isinstance(issue_type, str):
-                    issue_type_lower = issue_type.lower()
-
-                    if issue_type_lower in common_types:
-                        # Convert first letter to uppercase for standard Jira types
-                        issue_type_proper = issue_type_lower.capitalize()
-                        if (
-                            issue_type_lower == "new feature"
-                            or issue_type_lower == "newfeature"
-                        ):
-                            issue_type_proper = "New Feature"
+                    issue_type_proper = _STANDARD_ISSUE_TYPES.get(issue_type.lower())
 
+                    if issue_type_proper is not None:
                         logger.debug(
-                            f"Converting issue type from '{issue_type}' to '{issue_type_proper}'"
+                            "Converting issue type from '%s' to '%s'",
+                            issue_type,
+                            issue_type_proper,
                         )
                         issue_dict["issuetype"] = {"name": issue_type_proper}
                     else:
@@ -835,83 +853,61 @@ class JiraServer:
 
                 # Process other fields
                 for key, value in fields.items():
-                    if key in [
-                        "project",
-                        "summary",
-                        "description",
-                        "issuetype",
-                        "issue_type",
-                    ]:
+                    if key in _PROCESSED_ISSUE_KEYS:
                         # Skip fields we've already processed
                         continue
 
                     # Handle special fields that require specific formats
-                    if key == "assignees" or key == "assignee":
-                        # Convert string to array for assignees or proper format for assignee
-                        if isinstance(value, str):
-                            if key == "assignees":
-                                issue_dict[key] = [value] if value else []
-                            else:  # assignee
-                                issue_dict[key] = {"name": value} if value else None
-                        elif isinstance(value, list) and key == "assignee" and value:
-                            # If assignee is a list but should be a dict with name
-                            issue_dict[key] = {"name": value[0]}
-                        else:
-                            issue_dict[key] = value
-                    elif key == "labels":
-                        # Convert string to array for labels
-                        if isinstance(value, str):
-                            issue_dict[key] = [value] if value else []
-                        else:
-                            issue_dict[key] = value
-                    elif key == "milestone":
-                        # Convert string to number for milestone
-                        if isinstance(value, str) and value.isdigit():
-                            issue_dict[key] = int(value)
-                        else:
-                            issue_dict[key] = value
-                    else:
-                        issue_dict[key] = value
+                    normalize = _FIELD_NORMALIZERS.get(key)
+                    issue_dict[key] = normalize(value) if normalize else value
 
                 # Add to the field list in v3 API format
                 processed_field_list.append({"fields": issue_dict})
 
-            logger.debug(f"Processed field list: {json.dumps(processed_field_list, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Processed field list: %s",
+                    json_compat.dumps(processed_field_list).decode(),
+                )
 
             # Use v3 API client
             v3_client = self._get_v3_api_client()
             
-            # Call the bulk create API
-            response_data = await v3_client.bulk_create_issues(processed_field_list)
-            
-            # Process the results to maintain compatibility with existing interface
-            processed_results = []
-            
-            # Handle successful issues
-            if "issues" in response_data:
-                for issue in response_data["issues"]:
-                    processed_results.append({
-                        "key": issue.get("key"),
-                        "id": issue.get("id"),
-                        "self": issue.get("self"),
-                        "success": True,
-                    })
+            # Call the bulk create API, sharding past Jira's per-request cap
+            if len(processed_field_list) > BULK_CREATE_LIMIT:
+                response_data = await v3_client.bulk_create_issues_many(
+                    processed_field_list
+                )
+            else:
+                response_data = await v3_client.bulk_create_issues(
+                    processed_field_list
+                )
             
-            # Handle errors
-            if "errors" in response_data:
-                for error in response_data["errors"]:
-                    processed_results.append({
-                        "error": error,
-                        "success": False,
-                    })
-
-            logger.info(f"Successfully processed {len(processed_results)} issue creations")
+            # Process the results to maintain compatibility with existing interface:
+            # successful issues first, then errors
+            processed_results = [
+                {
+                    "key": issue.get("key"),
+                    "id": issue.get("id"),
+                    "self": issue.get("self"),
+                    "success": True,
+                }
+                for issue in response_data.get("issues", [])
+            ]
+            processed_results.extend(
+                {"error": error, "success": False}
+                for error in response_data.get("errors", [])
+            )
+
+            logger.info(
+                "Successfully processed %s issue creations",
+                len(processed_results),
+            )
             return processed_results
 
         except Exception as e:
             error_msg = f"Failed to create issues in bulk: {type(e).__name__}: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            print(error_msg)
             raise ValueError(error_msg)
 
     async def add_jira_comment(self, issue_key: str, comment: str) -> Dict[str, Any]:
@@ -925,6 +921,7 @@ class JiraServer:
                 issue_id_or_key=issue_key,
                 comment=comment,
             )
+            self.invalidate_issue_cache(issue_key)
 
             # Extract useful information from the v3 API response
             response_data = {
@@ -941,7 +938,7 @@ class JiraServer:
             else:
                 response_data["author"] = "Unknown"
 
-            logger.info(f"Successfully added comment to issue {issue_key}")
+            logger.info("Successfully added comment to issue %s", issue_key)
             return response_data
 
         except Exception as e:
@@ -949,7 +946,6 @@ class JiraServer:
                 f"Failed to add comment to {issue_key}: {type(e).__name__}: {str(e)}"
             )
             logger.error(error_msg, exc_info=True)
-            print(error_msg)
             raise ValueError(error_msg)
 
     async def get_jira_transitions(self, issue_key: str) -> List[JiraTransitionResult]:
@@ -966,17 +962,18 @@ class JiraServer:
 
             # Convert to JiraTransitionResult objects maintaining compatibility
             results = [
-                JiraTransitionResult(id=transition["id"], name=transition["name"])
+                JiraTransitionResult.model_construct(
+                    id=transition["id"], name=transition["name"]
+                )
                 for transition in transitions
             ]
 
-            logger.info(f"Found {len(results)} transitions for issue {issue_key}")
+            logger.info("Found %s transitions for issue %s", len(results), issue_key)
             return results
 
         except Exception as e:
             error_msg = f"Failed to get transitions for {issue_key}: {type(e).__name__}: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            print(error_msg)
             raise ValueError(error_msg)
 
     async def transition_jira_issue(
@@ -998,9 +995,12 @@ class JiraServer:
                 fields=fields,
                 comment=comment,
             )
+            self.invalidate_issue_cache(issue_key)
 
             logger.info(
-                f"Successfully transitioned issue {issue_key} to transition {transition_id}"
+                "Successfully transitioned issue %s to transition %s",
+                issue_key,
+                transition_id,
             )
             return True
 
@@ -1009,7 +1009,6 @@ class JiraServer:
                 f"Failed to transition {issue_key}: {type(e).__name__}: {str(e)}"
             )
             logger.error(error_msg, exc_info=True)
-            print(error_msg)
             raise ValueError(error_msg)
 
     async def get_jira_project_issue_types(
@@ -1053,14 +1052,15 @@ class JiraServer:
                 )
 
             logger.info(
-                f"Found {len(issue_types)} issue types (project_key: {project_key})"
+                "Found %s issue types (project_key: %s)",
+                len(issue_types),
+                project_key,
             )
             return issue_types
 
         except Exception as e:
             error_msg = f"Failed to get issue types: {type(e).__name__}: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            print(error_msg)
             raise ValueError(error_msg)
 
     async def create_jira_project(
@@ -1076,7 +1076,7 @@ class JiraServer:
         projectCategory: Optional[int] = None,
         notificationScheme: Optional[int] = None,
         categoryId: Optional[int] = None,
-        url: str = "",
+        url: Optional[str] = None,
     ) -> JiraProjectResult:
         """Create a project using Jira's v3 REST API
 
@@ -1153,10 +1153,240 @@ class JiraServer:
 
         except Exception as e:
             error_msg = str(e)
-            print(f"Error creating project with v3 API: {error_msg}")
+            logger.error(
+                "Error creating project with v3 API: %s", error_msg, exc_info=True
+            )
             raise ValueError(f"Error creating project: {error_msg}")
 
 
+# The tool descriptors never change, so they are built once at import time
+_TOOLS: List[Tool] = [
+    Tool(
+        name=JiraTools.GET_PROJECTS.value,
+        description="Get all accessible Jira projects",
+        inputSchema={"type": "object", "properties": {}, "required": []},
+    ),
+    Tool(
+        name=JiraTools.GET_ISSUE.value,
+        description="Get details for a specific Jira issue by key",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The issue key (e.g., PROJECT-123)",
+                }
+            },
+            "required": ["issue_key"],
+        },
+    ),
+    Tool(
+        name=JiraTools.SEARCH_ISSUES.value,
+        description="Search for Jira issues using JQL (Jira Query Language)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": "JQL query string (e.g., 'project = MYPROJ AND status = \"In Progress\"')",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return (default: 10)",
+                },
+                "fields": {
+                    "type": "string",
+                    "description": "Comma-separated fields to return (e.g., 'summary,status,assignee'); all fields if omitted",
+                },
+            },
+            "required": ["jql"],
+        },
+    ),
+    Tool(
+        name=JiraTools.CREATE_ISSUE.value,
+        description="Create a new Jira issue. Common issue types include 'Bug', 'Task', 'Story', 'Epic' (capitalization handled automatically)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project": {
+                    "type": "string",
+                    "description": "Project key (e.g., 'MYPROJ')",
+                },
+                "summary": {
+                    "type": "string",
+                    "description": "Issue summary/title",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Issue description",
+                },
+                "issue_type": {
+                    "type": "string",
+                    "description": "Issue type (e.g., 'Bug', 'Task', 'Story', 'Epic', 'New Feature', 'Improvement'). IMPORTANT: Types are case-sensitive and vary by Jira instance.",
+                },
+                "fields": {
+                    "type": "object",
+                    "description": "Additional fields for the issue (optional)",
+                },
+            },
+            "required": ["project", "summary", "description", "issue_type"],
+        },
+    ),
+    Tool(
+        name=JiraTools.CREATE_ISSUES.value,
+        description="Bulk create new Jira issues. IMPORTANT: For 'issue_type', use the exact case-sensitive types in your Jira instance (common: 'Bug', 'Task', 'Story', 'Epic')",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "field_list": {
+                    "type": "array",
+                    "description": "A list of field dictionaries, each representing an issue to create",
+                    "items": {
+                        "type": "object",
+                        "description": "Field dictionary for a single issue",
+                    },
+                },
+                "prefetch": {
+                    "type": "boolean",
+                    "description": "Whether to reload created issues (default: true)",
+                },
+            },
+            "required": ["field_list"],
+        },
+    ),
+    Tool(
+        name=JiraTools.ADD_COMMENT.value,
+        description="Add a comment to a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The issue key (e.g., PROJECT-123)",
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "The comment text",
+                },
+            },
+            "required": ["issue_key", "comment"],
+        },
+    ),
+    Tool(
+        name=JiraTools.GET_TRANSITIONS.value,
+        description="Get available workflow transitions for a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The issue key (e.g., PROJECT-123)",
+                }
+            },
+            "required": ["issue_key"],
+        },
+    ),
+    Tool(
+        name=JiraTools.TRANSITION_ISSUE.value,
+        description="Transition a Jira issue to a new status",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The issue key (e.g., PROJECT-123)",
+                },
+                "transition_id": {
+                    "type": "string",
+                    "description": "ID of the transition to perform (get IDs using get_transitions)",
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Comment to add during transition (optional)",
+                },
+                "fields": {
+                    "type": "object",
+                    "description": "Additional fields to update during transition (optional)",
+                },
+            },
+            "required": ["issue_key", "transition_id"],
+        },
+    ),
+    Tool(
+        name=JiraTools.GET_PROJECT_ISSUE_TYPES.value,
+        description="Get all available issue types for a specific Jira project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {
+                    "type": "string",
+                    "description": "The project key (e.g., 'MYPROJ')",
+                }
+            },
+            "required": ["project_key"],
+        },
+    ),
+    Tool(
+        name=JiraTools.CREATE_PROJECT.value,
+        description="Create a new Jira project using v3 REST API",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "key": {
+                    "type": "string",
+                    "description": "Mandatory. Must match Jira project key requirements, usually only 2-10 uppercase characters.",
+                },
+                "name": {
+                    "type": "string",
+                    "description": "If not specified it will use the key value.",
+                },
+                "assignee": {
+                    "type": "string",
+                    "description": "Lead account ID or username (mapped to leadAccountId in v3 API).",
+                },
+                "ptype": {
+                    "type": "string",
+                    "description": "Project type key: 'software', 'business', or 'service_desk'. Defaults to 'software'.",
+                },
+                "template_name": {
+                    "type": "string",
+                    "description": "Project template key for creating from templates (mapped to projectTemplateKey in v3 API).",
+                },
+                "avatarId": {
+                    "type": ["integer", "string"],
+                    "description": "ID of the avatar to use for the project.",
+                },
+                "issueSecurityScheme": {
+                    "type": ["integer", "string"],
+                    "description": "Determines the security scheme to use.",
+                },
+                "permissionScheme": {
+                    "type": ["integer", "string"],
+                    "description": "Determines the permission scheme to use.",
+                },
+                "projectCategory": {
+                    "type": ["integer", "string"],
+                    "description": "Determines the category the project belongs to.",
+                },
+                "notificationScheme": {
+                    "type": ["integer", "string"],
+                    "description": "Determines the notification scheme to use. Default is None.",
+                },
+                "categoryId": {
+                    "type": ["integer", "string"],
+                    "description": "Same as projectCategory. Can be used interchangeably.",
+                },
+                "url": {
+                    "type": "string",
+                    "description": "A link to information about the project, such as documentation.",
+                },
+            },
+            "required": ["key"],
+        },
+    ),
+]
+
+
 async def serve(
     server_url: Optional[str] = None,
     auth_method: Optional[str] = None,
@@ -1164,6 +1394,12 @@ async def serve(
     password: Optional[str] = None,
     token: Optional[str] = None,
 ) -> None:
+    # Let short-lived tasks (e.g. gather fan-out) run eagerly until they first
+    # suspend, skipping a scheduling round-trip; available on Python 3.12+
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
     server = Server("mcp-jira")
     jira_server = JiraServer(
         server_url=server_url,
@@ -1176,234 +1412,14 @@ async def serve(
     @server.list_tools()
     async def list_tools() -> list[Tool]:
         """List available Jira tools."""
-        return [
-            Tool(
-                name=JiraTools.GET_PROJECTS.value,
-                description="Get all accessible Jira projects",
-                inputSchema={"type": "object", "properties": {}, "required": []},
-            ),
-            Tool(
-                name=JiraTools.GET_ISSUE.value,
-                description="Get details for a specific Jira issue by key",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "issue_key": {
-                            "type": "string",
-                            "description": "The issue key (e.g., PROJECT-123)",
-                        }
-                    },
-                    "required": ["issue_key"],
-                },
-            ),
-            Tool(
-                name=JiraTools.SEARCH_ISSUES.value,
-                description="Search for Jira issues using JQL (Jira Query Language)",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "jql": {
-                            "type": "string",
-                            "description": "JQL query string (e.g., 'project = MYPROJ AND status = \"In Progress\"')",
-                        },
-                        "max_results": {
-                            "type": "integer",
-                            "description": "Maximum number of results to return (default: 10)",
-                        },
-                    },
-                    "required": ["jql"],
-                },
-            ),
-            Tool(
-                name=JiraTools.CREATE_ISSUE.value,
-                description="Create a new Jira issue. Common issue types include 'Bug', 'Task', 'Story', 'Epic' (capitalization handled automatically)",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project": {
-                            "type": "string",
-                            "description": "Project key (e.g., 'MYPROJ')",
-                        },
-                        "summary": {
-                            "type": "string",
-                            "description": "Issue summary/title",
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Issue description",
-                        },
-                        "issue_type": {
-                            "type": "string",
-                            "description": "Issue type (e.g., 'Bug', 'Task', 'Story', 'Epic', 'New Feature', 'Improvement'). IMPORTANT: Types are case-sensitive and vary by Jira instance.",
-                        },
-                        "fields": {
-                            "type": "object",
-                            "description": "Additional fields for the issue (optional)",
-                        },
-                    },
-                    "required": ["project", "summary", "description", "issue_type"],
-                },
-            ),
-            Tool(
-                name=JiraTools.CREATE_ISSUES.value,
-                description="Bulk create new Jira issues. IMPORTANT: For 'issue_type', use the exact case-sensitive types in your Jira instance (common: 'Bug', 'Task', 'Story', 'Epic')",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "field_list": {
-                            "type": "array",
-                            "description": "A list of field dictionaries, each representing an issue to create",
-                            "items": {
-                                "type": "object",
-                                "description": "Field dictionary for a single issue",
-                            },
-                        },
-                        "prefetch": {
-                            "type": "boolean",
-                            "description": "Whether to reload created issues (default: true)",
-                        },
-                    },
-                    "required": ["field_list"],
-                },
-            ),
-            Tool(
-                name=JiraTools.ADD_COMMENT.value,
-                description="Add a comment to a Jira issue",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "issue_key": {
-                            "type": "string",
-                            "description": "The issue key (e.g., PROJECT-123)",
-                        },
-                        "comment": {
-                            "type": "string",
-                            "description": "The comment text",
-                        },
-                    },
-                    "required": ["issue_key", "comment"],
-                },
-            ),
-            Tool(
-                name=JiraTools.GET_TRANSITIONS.value,
-                description="Get available workflow transitions for a Jira issue",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "issue_key": {
-                            "type": "string",
-                            "description": "The issue key (e.g., PROJECT-123)",
-                        }
-                    },
-                    "required": ["issue_key"],
-                },
-            ),
-            Tool(
-                name=JiraTools.TRANSITION_ISSUE.value,
-                description="Transition a Jira issue to a new status",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "issue_key": {
-                            "type": "string",
-                            "description": "The issue key (e.g., PROJECT-123)",
-                        },
-                        "transition_id": {
-                            "type": "string",
-                            "description": "ID of the transition to perform (get IDs using get_transitions)",
-                        },
-                        "comment": {
-                            "type": "string",
-                            "description": "Comment to add during transition (optional)",
-                        },
-                        "fields": {
-                            "type": "object",
-                            "description": "Additional fields to update during transition (optional)",
-                        },
-                    },
-                    "required": ["issue_key", "transition_id"],
-                },
-            ),
-            Tool(
-                name=JiraTools.GET_PROJECT_ISSUE_TYPES.value,
-                description="Get all available issue types for a specific Jira project",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_key": {
-                            "type": "string",
-                            "description": "The project key (e.g., 'MYPROJ')",
-                        }
-                    },
-                    "required": ["project_key"],
-                },
-            ),
-            Tool(
-                name=JiraTools.CREATE_PROJECT.value,
-                description="Create a new Jira project using v3 REST API",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "key": {
-                            "type": "string",
-                            "description": "Mandatory. Must match Jira project key requirements, usually only 2-10 uppercase characters.",
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "If not specified it will use the key value.",
-                        },
-                        "assignee": {
-                            "type": "string",
-                            "description": "Lead account ID or username (mapped to leadAccountId in v3 API).",
-                        },
-                        "ptype": {
-                            "type": "string",
-                            "description": "Project type key: 'software', 'business', or 'service_desk'. Defaults to 'software'.",
-                        },
-                        "template_name": {
-                            "type": "string",
-                            "description": "Project template key for creating from templates (mapped to projectTemplateKey in v3 API).",
-                        },
-                        "avatarId": {
-                            "type": ["integer", "string"],
-                            "description": "ID of the avatar to use for the project.",
-                        },
-                        "issueSecurityScheme": {
-                            "type": ["integer", "string"],
-                            "description": "Determines the security scheme to use.",
-                        },
-                        "permissionScheme": {
-                            "type": ["integer", "string"],
-                            "description": "Determines the permission scheme to use.",
-                        },
-                        "projectCategory": {
-                            "type": ["integer", "string"],
-                            "description": "Determines the category the project belongs to.",
-                        },
-                        "notificationScheme": {
-                            "type": ["integer", "string"],
-                            "description": "Determines the notification scheme to use. Default is None.",
-                        },
-                        "categoryId": {
-                            "type": ["integer", "string"],
-                            "description": "Same as projectCategory. Can be used interchangeably.",
-                        },
-                        "url": {
-                            "type": "string",
-                            "description": "A link to information about the project, such as documentation.",
-                        },
-                    },
-                    "required": ["key"],
-                },
-            ),
-        ]
+        return list(_TOOLS)
 
     @server.call_tool()
     async def call_tool(
         name: str, arguments: dict
     ) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         """Handle tool calls for Jira operations."""
-        logger.info(f"call_tool invoked. Tool: '{name}', Arguments: {arguments}")
+        logger.info("call_tool invoked. Tool: '%s', Arguments: %s", name, arguments)
         try:
             result: Any
 
@@ -1412,7 +1428,8 @@ async def serve(
                     logger.info("About to AWAIT jira_server.get_jira_projects...")
                     result = await jira_server.get_jira_projects()
                     logger.info(
-                        f"COMPLETED await jira_server.get_jira_projects. Result has {len(result)} items."
+                        "COMPLETED await jira_server.get_jira_projects. Result has %s items.",
+                        len(result),
                     )
 
                 case JiraTools.GET_ISSUE.value:
@@ -1429,7 +1446,9 @@ async def serve(
                     if not jql:
                         raise ValueError("Missing required argument: jql")
                     max_results = arguments.get("max_results", 10)
-                    result = await jira_server.search_jira_issues(jql, max_results)
+                    result = await jira_server.search_jira_issues(
+                        jql, max_results, arguments.get("fields")
+                    )
                     logger.info("Async tool search_jira_issues completed.")
 
                 case JiraTools.CREATE_ISSUE.value:
@@ -1550,7 +1569,7 @@ async def serve(
                     # It's already a dict or basic type
                     serialized_result = result
 
-            json_result = json.dumps(serialized_result, indent=2)
+            json_result = json_compat.dumps_pretty(serialized_result)
             return [TextContent(type="text", text=json_result)]
 
         except Exception as e:
@@ -1560,14 +1579,17 @@ async def serve(
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(
+                    text=json_compat.dumps(
                         {
                             "error": f"Error in tool '{name}': {type(e).__name__}: {str(e)}"
                         }
-                    ),
+                    ).decode(),
                 )
             ]
 
     options = server.create_initialization_options()
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, options)
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, options)
+    finally:
+        await jira_server.aclose()
@@ -2,6 +2,7 @@
 
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock
+import orjson
 import pytest
 
 from src.mcp_server_jira.jira_v3_api import JiraV3APIClient
@@ -43,7 +44,7 @@ class TestAddCommentV3API:
 
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = orjson.dumps(mock_response_data)
         mock_response.text = ""
         mock_response.raise_for_status.return_value = None
 
@@ -71,7 +72,7 @@ class TestAddCommentV3API:
         assert "https://test.atlassian.net/rest/api/3/issue/PROJ-123/comment" in call_args[1]["url"]
         
         # Verify the request payload
-        payload = call_args[1]["json"]
+        payload = orjson.loads(call_args[1]["content"])
         assert payload["body"]["type"] == "doc"
         assert payload["body"]["version"] == 1
         assert len(payload["body"]["content"]) == 1
@@ -110,7 +111,7 @@ class TestAddCommentV3API:
 
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = orjson.dumps(mock_response_data)
         mock_response.text = ""
         mock_response.raise_for_status.return_value = None
 
@@ -136,7 +137,7 @@ class TestAddCommentV3API:
 
         # Verify the request payload includes visibility
         call_args = mock_client.request.call_args
-        payload = call_args[1]["json"]
+        payload = orjson.loads(call_args[1]["content"])
         
         assert "visibility" in payload
         assert payload["visibility"]["type"] == "role"
@@ -206,7 +207,7 @@ class TestAddCommentV3API:
 
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = orjson.dumps(mock_response_data)
         mock_response.text = ""
         mock_response.raise_for_status.return_value = None
 
@@ -232,7 +233,7 @@ class TestAddCommentV3API:
 
         # Verify the request payload includes properties
         call_args = mock_client.request.call_args
-        payload = call_args[1]["json"]
+        payload = orjson.loads(call_args[1]["content"])
         
         assert "properties" in payload
         assert len(payload["properties"]) == 1
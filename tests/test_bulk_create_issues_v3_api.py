@@ -2,6 +2,7 @@
 
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock
+import orjson
 import pytest
 
 from src.mcp_server_jira.jira_v3_api import JiraV3APIClient
@@ -16,7 +17,7 @@ class TestBulkCreateIssuesV3API:
         # Mock 201 Created response
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "issues": [
                 {
                     "id": "10000",
@@ -30,7 +31,7 @@ class TestBulkCreateIssuesV3API:
                 }
             ],
             "errors": []
-        }
+        })
         mock_response.text = ""
         mock_response.raise_for_status.return_value = None
 
@@ -93,7 +94,7 @@ class TestBulkCreateIssuesV3API:
 
         assert call_args[1]["method"] == "POST"
         assert "/rest/api/3/issue/bulk" in call_args[1]["url"]
-        assert call_args[1]["json"]["issueUpdates"] == issue_updates
+        assert orjson.loads(call_args[1]["content"])["issueUpdates"] == issue_updates
         
         # Verify the response
         assert "issues" in result
@@ -135,7 +136,7 @@ class TestBulkCreateIssuesV3API:
         # Mock response with partial success
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "issues": [
                 {
                     "id": "10000",
@@ -151,7 +152,7 @@ class TestBulkCreateIssuesV3API:
                     }
                 }
             ]
-        }
+        })
         mock_response.text = ""
         mock_response.raise_for_status.return_value = None
 
@@ -192,4 +193,32 @@ class TestBulkCreateIssuesV3API:
         assert len(result["issues"]) == 1
         assert len(result["errors"]) == 1
         assert result["issues"][0]["key"] == "PROJ-1"
-        assert "errorMessages" in result["errors"][0]["elementErrors"]
\ No newline at end of file
+        assert "errorMessages" in result["errors"][0]["elementErrors"]
+    @pytest.mark.asyncio
+    async def test_v3_api_bulk_create_issues_many_shards_and_merges(self):
+        """Test that bulk_create_issues_many splits into 50-issue chunks and merges results"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken"
+        )
+
+        async def create(chunk):
+            if chunk[0]["fields"]["summary"] == "Issue 50":
+                raise ValueError("Jira API v3 request failed: 503")
+            return {
+                "issues": [{"key": chunk[0]["fields"]["summary"]}],
+                "errors": [{"failedElementNumber": 1, "elementErrors": {}}],
+            }
+
+        client.bulk_create_issues = AsyncMock(side_effect=create)
+        issue_updates = [{"fields": {"summary": f"Issue {i}"}} for i in range(120)]
+
+        result = await client.bulk_create_issues_many(issue_updates, concurrency=2)
+
+        sizes = [len(c.args[0]) for c in client.bulk_create_issues.await_args_list]
+        assert sorted(sizes) == [20, 50, 50]
+        assert [issue["key"] for issue in result["issues"]] == ["Issue 0", "Issue 100"]
+        failed = [error["failedElementNumber"] for error in result["errors"]]
+        assert failed == [1] + list(range(50, 100)) + [101]
+        assert "503" in result["errors"][1]["elementErrors"]["errorMessages"][0]
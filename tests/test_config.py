@@ -0,0 +1,82 @@
+"""
+Tests for configuration loading.
+"""
+
+import os
+
+import pytest
+
+from src.mcp_server_jira import config as config_module
+from src.mcp_server_jira.config import JiraConfig, load_config
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    config_module._build_config.cache_clear()
+    yield
+    config_module._build_config.cache_clear()
+
+
+class TestLoadConfig:
+    """Test suite for load_config"""
+
+    def test_reads_environment(self, monkeypatch, tmp_path):
+        """Test that settings are read from the environment"""
+        monkeypatch.setattr(config_module, "ENV_PATH", tmp_path / ".env")
+        monkeypatch.setenv("JIRA_SERVER_URL", "https://test.atlassian.net")
+        monkeypatch.setenv("JIRA_USERNAME", "testuser")
+        monkeypatch.setenv("JIRA_TOKEN", "testtoken")
+        monkeypatch.delenv("JIRA_AUTH_METHOD", raising=False)
+        monkeypatch.delenv("JIRA_PASSWORD", raising=False)
+
+        config = load_config()
+
+        assert config == JiraConfig(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+
+    def test_result_is_cached(self, monkeypatch, tmp_path):
+        """Test that the configuration is only built once"""
+        monkeypatch.setattr(config_module, "ENV_PATH", tmp_path / ".env")
+        monkeypatch.setenv("JIRA_SERVER_URL", "https://first.atlassian.net")
+        first = load_config()
+
+        monkeypatch.setenv("JIRA_SERVER_URL", "https://second.atlassian.net")
+
+        assert load_config() is first
+        assert load_config().server_url == "https://first.atlassian.net"
+
+    def test_environment_overrides_env_file(self, monkeypatch, tmp_path):
+        """Test that environment variables take precedence over the .env file"""
+        pytest.importorskip("dotenv")
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "JIRA_SERVER_URL=https://file.atlassian.net\nJIRA_USERNAME=fileuser\n"
+        )
+        monkeypatch.setattr(config_module, "ENV_PATH", env_file)
+        monkeypatch.setenv("JIRA_SERVER_URL", "https://env.atlassian.net")
+        monkeypatch.delenv("JIRA_USERNAME", raising=False)
+
+        config = load_config()
+
+        assert config.server_url == "https://env.atlassian.net"
+        assert config.username == "fileuser"
+
+    def test_env_file_reparsed_only_when_modified(self, monkeypatch, tmp_path):
+        """Test that the .env parse is reused until the file changes"""
+        pytest.importorskip("dotenv")
+        env_file = tmp_path / ".env"
+        env_file.write_text("JIRA_USERNAME=first\n")
+        monkeypatch.setattr(config_module, "ENV_PATH", env_file)
+        monkeypatch.delenv("JIRA_USERNAME", raising=False)
+
+        first = load_config()
+        assert first.username == "first"
+        assert load_config() is first
+
+        env_file.write_text("JIRA_USERNAME=second\n")
+        os.utime(env_file, ns=(0, env_file.stat().st_mtime_ns + 1_000_000_000))
+
+        assert load_config().username == "second"
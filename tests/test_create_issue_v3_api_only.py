@@ -3,6 +3,7 @@
 import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
+import orjson
 import pytest
 
 from src.mcp_server_jira.jira_v3_api import JiraV3APIClient
@@ -17,11 +18,11 @@ class TestCreateIssueV3API:
         # Mock 201 Created response (standard for successful creation)
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "id": "10000",
             "key": "PROJ-123",
             "self": "https://test.atlassian.net/rest/api/3/issue/10000",
-        }
+        })
         mock_response.text = '{"id":"10000","key":"PROJ-123","self":"https://test.atlassian.net/rest/api/3/issue/10000"}'
         mock_response.raise_for_status.return_value = None
 
@@ -59,7 +60,7 @@ class TestCreateIssueV3API:
         assert "/rest/api/3/issue" in call_args[1]["url"]
 
         # Verify the payload
-        payload = call_args[1]["json"]
+        payload = orjson.loads(call_args[1]["content"])
         assert payload["fields"] == fields
 
     @pytest.mark.asyncio
@@ -68,11 +69,11 @@ class TestCreateIssueV3API:
         # Mock 201 Created response
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "id": "10001",
             "key": "PROJ-124",
             "self": "https://test.atlassian.net/rest/api/3/issue/10001",
-        }
+        })
         mock_response.text = '{"id":"10001","key":"PROJ-124","self":"https://test.atlassian.net/rest/api/3/issue/10001"}'
         mock_response.raise_for_status.return_value = None
 
@@ -113,7 +114,7 @@ class TestCreateIssueV3API:
         call_args = mock_client.request.call_args
 
         # Verify the payload contains all optional parameters
-        payload = call_args[1]["json"]
+        payload = orjson.loads(call_args[1]["content"])
         assert payload["fields"] == fields
         assert payload["update"] == update
         assert payload["properties"] == properties
@@ -84,6 +84,24 @@ class TestCreateJiraIssuesServer:
             assert result[1]["key"] == "PROJ-2"
             assert result[1]["success"] is True
 
+    @pytest.mark.asyncio
+    async def test_create_jira_issues_validates_before_building_payloads(self):
+        """Test that an invalid entry late in the list fails before any API call"""
+        server = JiraServer(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            password="testpass"
+        )
+        valid = {"project": "PROJ", "summary": "Test issue", "issue_type": "Bug"}
+
+        with patch.object(server, '_get_v3_api_client') as mock_get_client:
+            with pytest.raises(ValueError, match=r"'summary' field \(issue 3\)"):
+                await server.create_jira_issues(
+                    [valid, valid, {"project": "PROJ", "issue_type": "Bug"}]
+                )
+
+        mock_get_client.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_create_jira_issues_missing_required_fields(self):
         """Test create_jira_issues with missing required fields"""
@@ -2,6 +2,7 @@
 
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock
+import orjson
 import pytest
 
 from src.mcp_server_jira.jira_v3_api import JiraV3APIClient
@@ -44,7 +45,7 @@ class TestGetTransitionsV3APIConversion:
         # Mock httpx response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = orjson.dumps(mock_response_data)
         mock_response.text = str(mock_response_data)
         mock_response.raise_for_status.return_value = None
 
@@ -78,7 +79,7 @@ class TestGetTransitionsV3APIConversion:
         """Test get transitions with query parameters"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"transitions": []}
+        mock_response.content = orjson.dumps({"transitions": []})
         mock_response.text = "{\"transitions\": []}"
         mock_response.raise_for_status.return_value = None
 
@@ -134,7 +135,7 @@ class TestGetTransitionsV3APIConversion:
             token="testtoken"
         )
 
-        with patch.object(server._v3_api_client, 'get_transitions', new_callable=AsyncMock) as mock_get_transitions:
+        with patch.object(server._get_v3_api_client(), 'get_transitions', new_callable=AsyncMock) as mock_get_transitions:
             mock_get_transitions.return_value = mock_api_response
 
             result = await server.get_jira_transitions("PROJ-123")
@@ -164,7 +165,7 @@ class TestGetTransitionsV3APIConversion:
             token="testtoken"
         )
 
-        with patch.object(server._v3_api_client, 'get_transitions', new_callable=AsyncMock) as mock_get_transitions:
+        with patch.object(server._get_v3_api_client(), 'get_transitions', new_callable=AsyncMock) as mock_get_transitions:
             mock_get_transitions.side_effect = Exception("API Error")
 
             with pytest.raises(ValueError) as exc_info:
@@ -189,7 +190,7 @@ class TestGetTransitionsV3APIConversion:
             token="testtoken"
         )
 
-        with patch.object(server._v3_api_client, 'get_transitions', new_callable=AsyncMock) as mock_get_transitions:
+        with patch.object(server._get_v3_api_client(), 'get_transitions', new_callable=AsyncMock) as mock_get_transitions:
             mock_get_transitions.return_value = mock_api_response
 
             result = await server.get_jira_transitions("PROJ-123")
@@ -4,11 +4,14 @@ Tests for the Jira v3 API client functionality.
 """
 
 
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock
 
+import orjson
 import pytest  # pylint: disable=import-error
 
-from src.mcp_server_jira.jira_v3_api import JiraV3APIClient
+from src.mcp_server_jira import jira_v3_api
+from src.mcp_server_jira.jira_v3_api import ERROR_BODY_LIMIT, JiraV3APIClient
 
 
 class TestJiraV3APIClient:
@@ -23,118 +26,145 @@ class TestJiraV3APIClient:
         )
         assert client.server_url == "https://test.atlassian.net"
         assert client.username == "testuser"
-        assert client.password == "testpass"
-        assert client.token is None
+        assert client.auth_token == "testpass"
 
     def test_init_with_token(self):
-        """Test initialization with token only"""
+        """Test that an API token takes precedence over a password"""
         client = JiraV3APIClient(
-            server_url="https://test.atlassian.net", token="test-token"
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            password="testpass",
+            token="test-token",
         )
         assert client.server_url == "https://test.atlassian.net"
-        assert client.username is None
-        assert client.password is None
-        assert client.token == "test-token"
+        assert client.username == "testuser"
+        assert client.auth_token == "test-token"
+
+    def test_init_requires_username(self):
+        """Test that a token without a username is rejected"""
+        with pytest.raises(ValueError, match="username"):
+            JiraV3APIClient(server_url="https://test.atlassian.net", token="test-token")
 
-    @patch("src.mcp_server_jira.jira_v3_api.requests.request")
-    def test_make_v3_api_request_success(self, mock_request):
+    @pytest.mark.asyncio
+    async def test_make_v3_api_request_success(self):
         """Test successful API request"""
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"key": "TEST", "name": "Test Project"}
-        mock_request.return_value = mock_response
+        mock_response.content = orjson.dumps({"key": "TEST", "name": "Test Project"})
 
         client = JiraV3APIClient(
             server_url="https://test.atlassian.net",
             username="testuser",
             token="testtoken",
         )
+        client.client = AsyncMock()
+        client.client.request.return_value = mock_response
 
-        result = client._make_v3_api_request("POST", "/project", {"test": "data"})
+        result = await client._make_v3_api_request("POST", "/project", {"test": "data"})
 
         assert result == {"key": "TEST", "name": "Test Project"}
-        mock_request.assert_called_once()
+        client.client.request.assert_called_once()
 
-    @patch("src.mcp_server_jira.jira_v3_api.requests.request")
-    def test_make_v3_api_request_error(self, mock_request):
+        call_args = client.client.request.call_args
+        assert call_args[1]["method"] == "POST"
+        assert call_args[1]["url"] == "https://test.atlassian.net/rest/api/3/project"
+        assert orjson.loads(call_args[1]["content"]) == {"test": "data"}
+
+    @pytest.mark.asyncio
+    async def test_make_v3_api_request_error(self):
         """Test API request with error response"""
+        from httpx import HTTPStatusError, Request
+
         # Setup mock error response
         mock_response = Mock()
         mock_response.status_code = 400
-        mock_response.json.return_value = {"errorMessages": ["Bad request"]}
-        mock_request.return_value = mock_response
+        mock_response.reason_phrase = "Bad Request"
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.content = orjson.dumps({"errorMessages": ["Bad request"]})
 
         client = JiraV3APIClient(
             server_url="https://test.atlassian.net",
             username="testuser",
             token="testtoken",
         )
+        client.client = AsyncMock()
+        mock_request = Mock(spec=Request)
+        mock_request.url = "https://test.atlassian.net/rest/api/3/project"
+        client.client.request.side_effect = HTTPStatusError(
+            "400 Bad Request", request=mock_request, response=mock_response
+        )
 
-        with pytest.raises(ValueError, match="HTTP 400"):
-            client._make_v3_api_request("POST", "/project", {"test": "data"})
+        with pytest.raises(ValueError, match="400 Bad Request. Bad request"):
+            await client._make_v3_api_request("POST", "/project", {"test": "data"})
 
-    @patch("src.mcp_server_jira.jira_v3_api.requests.request")
-    def test_create_project_success(self, mock_request):
+    @pytest.mark.asyncio
+    async def test_create_project_success(self):
         """Test successful project creation"""
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "self": "https://test.atlassian.net/rest/api/3/project/10000",
-            "id": "10000",
-            "key": "TEST",
-            "name": "Test Project",
-        }
-        mock_request.return_value = mock_response
+        mock_response.content = orjson.dumps(
+            {
+                "self": "https://test.atlassian.net/rest/api/3/project/10000",
+                "id": "10000",
+                "key": "TEST",
+                "name": "Test Project",
+            }
+        )
 
         client = JiraV3APIClient(
             server_url="https://test.atlassian.net",
             username="testuser",
             token="testtoken",
         )
+        client.client = AsyncMock()
+        client.client.request.return_value = mock_response
 
-        result = client.create_project(
-            key="TEST", name="Test Project", ptype="software"
+        result = await client.create_project(
+            key="TEST", name="Test Project", ptype="software", assignee="user123"
         )
 
         assert result["key"] == "TEST"
         assert result["name"] == "Test Project"
-        mock_request.assert_called_once()
+        client.client.request.assert_called_once()
 
         # Verify the request was made with correct data
-        call_args = mock_request.call_args
+        call_args = client.client.request.call_args
         assert call_args[1]["method"] == "POST"
         assert "/rest/api/3/project" in call_args[1]["url"]
 
         # Check the request body
-        request_data = call_args[1]["json"]
+        request_data = orjson.loads(call_args[1]["content"])
         assert request_data["key"] == "TEST"
         assert request_data["name"] == "Test Project"
         assert request_data["projectTypeKey"] == "software"
         assert request_data["assigneeType"] == "PROJECT_LEAD"
 
-    @patch("src.mcp_server_jira.jira_v3_api.requests.request")
-    def test_create_project_with_template(self, mock_request):
+    @pytest.mark.asyncio
+    async def test_create_project_with_template(self):
         """Test project creation with template"""
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "self": "https://test.atlassian.net/rest/api/3/project/10000",
-            "id": "10000",
-            "key": "TEMP",
-            "name": "Template Project",
-        }
-        mock_request.return_value = mock_response
+        mock_response.content = orjson.dumps(
+            {
+                "self": "https://test.atlassian.net/rest/api/3/project/10000",
+                "id": "10000",
+                "key": "TEMP",
+                "name": "Template Project",
+            }
+        )
 
         client = JiraV3APIClient(
             server_url="https://test.atlassian.net",
             username="testuser",
             token="testtoken",
         )
+        client.client = AsyncMock()
+        client.client.request.return_value = mock_response
 
-        result = client.create_project(
+        result = await client.create_project(
             key="TEMP",
             name="Template Project",
             ptype="business",
@@ -143,11 +173,11 @@ class TestJiraV3APIClient:
         )
 
         assert result["key"] == "TEMP"
-        mock_request.assert_called_once()
+        client.client.request.assert_called_once()
 
         # Verify the request data includes template information
-        call_args = mock_request.call_args
-        request_data = call_args[1]["json"]
+        call_args = client.client.request.call_args
+        request_data = orjson.loads(call_args[1]["content"])
         assert (
             request_data["projectTemplateKey"]
             == "com.atlassian.jira-core-project-templates:jira-core-project-management"
@@ -155,7 +185,8 @@ class TestJiraV3APIClient:
         assert request_data["leadAccountId"] == "user123"
         assert request_data["projectTypeKey"] == "business"
 
-    def test_create_project_missing_key(self):
+    @pytest.mark.asyncio
+    async def test_create_project_missing_key(self):
         """Test project creation with missing key"""
         client = JiraV3APIClient(
             server_url="https://test.atlassian.net",
@@ -164,9 +195,10 @@ class TestJiraV3APIClient:
         )
 
         with pytest.raises(ValueError, match="Project key is required"):
-            client.create_project(key="")
+            await client.create_project(key="")
 
-    def test_create_project_missing_assignee(self):
+    @pytest.mark.asyncio
+    async def test_create_project_missing_assignee(self):
         """Test project creation with missing assignee"""
         client = JiraV3APIClient(
             server_url="https://test.atlassian.net",
@@ -175,204 +207,182 @@ class TestJiraV3APIClient:
         )
 
         with pytest.raises(ValueError, match="Parameter 'assignee'"):
-            client.create_project(key="TEST")
+            await client.create_project(key="TEST")
 
-    @patch("src.mcp_server_jira.jira_v3_api.requests.request")
-    def test_authentication_username_token(self, mock_request):
-        """Test authentication with username and token"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"test": "data"}
-        mock_request.return_value = mock_response
-
-        client = JiraV3APIClient(
-            server_url="https://test.atlassian.net",
-            username="testuser",
-            token="testtoken",
-        )
-
-        client._make_v3_api_request("GET", "/test")
-
-        call_args = mock_request.call_args
-        auth = call_args[1]["auth"]
-        assert auth == ("testuser", "testtoken")
-
-    @patch("src.mcp_server_jira.jira_v3_api.requests.request")
-    def test_authentication_token_only(self, mock_request):
-        """Test authentication with token only"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"test": "data"}
-        mock_request.return_value = mock_response
-
-        client = JiraV3APIClient(
-            server_url="https://test.atlassian.net", token="testtoken"
-        )
-
-        client._make_v3_api_request("GET", "/test")
-
-        call_args = mock_request.call_args
-        headers = call_args[1]["headers"]
-        assert "Authorization" in headers
-        assert headers["Authorization"] == "Bearer testtoken"
-
-    @patch("src.mcp_server_jira.jira_v3_api.requests.request")
-    def test_get_projects_success(self, mock_request):
+    @pytest.mark.asyncio
+    async def test_get_projects_success(self):
         """Test successful get projects request"""
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "startAt": 0,
-            "maxResults": 50,
-            "total": 2,
-            "isLast": True,
-            "values": [
-                {
-                    "id": "10000",
-                    "key": "TEST",
-                    "name": "Test Project",
-                    "lead": {"displayName": "John Doe"}
-                },
-                {
-                    "id": "10001",
-                    "key": "DEMO", 
-                    "name": "Demo Project",
-                    "lead": {"displayName": "Jane Smith"}
-                }
-            ]
-        }
-        mock_request.return_value = mock_response
+        mock_response.headers = {}
+        mock_response.content = orjson.dumps(
+            {
+                "startAt": 0,
+                "maxResults": 50,
+                "total": 2,
+                "isLast": True,
+                "values": [
+                    {
+                        "id": "10000",
+                        "key": "TEST",
+                        "name": "Test Project",
+                        "lead": {"displayName": "John Doe"},
+                    },
+                    {
+                        "id": "10001",
+                        "key": "DEMO",
+                        "name": "Demo Project",
+                        "lead": {"displayName": "Jane Smith"},
+                    },
+                ],
+            }
+        )
 
         client = JiraV3APIClient(
             server_url="https://test.atlassian.net",
             username="testuser",
             token="testtoken",
         )
+        client.client = AsyncMock()
+        client.client.request.return_value = mock_response
 
-        result = client.get_projects()
+        result = await client.get_projects()
 
         assert result["total"] == 2
         assert len(result["values"]) == 2
         assert result["values"][0]["key"] == "TEST"
         assert result["values"][1]["key"] == "DEMO"
-        mock_request.assert_called_once()
+        client.client.request.assert_called_once()
 
         # Verify the request was made to the correct endpoint
-        call_args = mock_request.call_args
+        call_args = client.client.request.call_args
         assert call_args[1]["method"] == "GET"
         assert "/rest/api/3/project/search" in call_args[1]["url"]
 
-    @patch("src.mcp_server_jira.jira_v3_api.requests.request")
-    def test_get_projects_with_parameters(self, mock_request):
+    @pytest.mark.asyncio
+    async def test_get_projects_with_parameters(self):
         """Test get projects with query parameters"""
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "startAt": 10,
-            "maxResults": 20,
-            "total": 50,
-            "isLast": False,
-            "values": []
-        }
-        mock_request.return_value = mock_response
+        mock_response.headers = {}
+        mock_response.content = orjson.dumps(
+            {
+                "startAt": 10,
+                "maxResults": 20,
+                "total": 50,
+                "isLast": False,
+                "values": [],
+            }
+        )
 
         client = JiraV3APIClient(
             server_url="https://test.atlassian.net",
             username="testuser",
             token="testtoken",
         )
+        client.client = AsyncMock()
+        client.client.request.return_value = mock_response
 
-        result = client.get_projects(
+        result = await client.get_projects(
             start_at=10,
             max_results=20,
             order_by="name",
             query="test",
-            keys=["PROJ1", "PROJ2"]
+            keys=["PROJ1", "PROJ2"],
         )
 
         assert result["startAt"] == 10
         assert result["maxResults"] == 20
-        mock_request.assert_called_once()
-
-        # Verify the request URL includes query parameters
-        call_args = mock_request.call_args
-        url = call_args[1]["url"]
-        assert "startAt=10" in url
-        assert "maxResults=20" in url
-        assert "orderBy=name" in url
-        assert "query=test" in url
-        assert "keys=PROJ1,PROJ2" in url
-
-    @patch("src.mcp_server_jira.jira_v3_api.requests.request")
-    def test_get_projects_error(self, mock_request):
+        client.client.request.assert_called_once()
+
+        # Verify the query parameters, leaving out the unset ones
+        params = client.client.request.call_args[1]["params"]
+        assert params == [
+            ("startAt", 10),
+            ("maxResults", 20),
+            ("orderBy", "name"),
+            ("query", "test"),
+            ("keys", "PROJ1"),
+            ("keys", "PROJ2"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_projects_error(self):
         """Test get projects with error response"""
+        from httpx import HTTPStatusError, Request
+
         # Setup mock error response
         mock_response = Mock()
         mock_response.status_code = 401
-        mock_response.json.return_value = {"errorMessages": ["Unauthorized"]}
-        mock_request.return_value = mock_response
+        mock_response.reason_phrase = "Unauthorized"
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.content = orjson.dumps({"errorMessages": ["Unauthorized"]})
 
         client = JiraV3APIClient(
             server_url="https://test.atlassian.net",
             username="testuser",
             token="testtoken",
         )
+        client.client = AsyncMock()
+        mock_request = Mock(spec=Request)
+        mock_request.url = "https://test.atlassian.net/rest/api/3/project/search"
+        client.client.request.side_effect = HTTPStatusError(
+            "401 Unauthorized", request=mock_request, response=mock_response
+        )
 
-        with pytest.raises(ValueError, match="HTTP 401"):
-            client.get_projects()
+        with pytest.raises(ValueError, match="401 Unauthorized"):
+            await client.get_projects()
 
-    @patch("src.mcp_server_jira.jira_v3_api.httpx.AsyncClient")
-    async def test_get_transitions_success(self, mock_async_client):
+    @pytest.mark.asyncio
+    async def test_get_transitions_success(self):
         """Test successful get transitions request"""
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "transitions": [
-                {
-                    "id": "2",
-                    "name": "Close Issue",
-                    "to": {
-                        "id": "10000",
-                        "name": "Done",
-                        "description": "Issue is done"
+        mock_response.content = orjson.dumps(
+            {
+                "transitions": [
+                    {
+                        "id": "2",
+                        "name": "Close Issue",
+                        "to": {
+                            "id": "10000",
+                            "name": "Done",
+                            "description": "Issue is done",
+                        },
+                        "hasScreen": False,
+                        "isAvailable": True,
+                        "isConditional": False,
+                        "isGlobal": False,
+                        "isInitial": False,
                     },
-                    "hasScreen": False,
-                    "isAvailable": True,
-                    "isConditional": False,
-                    "isGlobal": False,
-                    "isInitial": False
-                },
-                {
-                    "id": "711",
-                    "name": "QA Review",
-                    "to": {
-                        "id": "5",
-                        "name": "In Review",
-                        "description": "Issue is under review"
+                    {
+                        "id": "711",
+                        "name": "QA Review",
+                        "to": {
+                            "id": "5",
+                            "name": "In Review",
+                            "description": "Issue is under review",
+                        },
+                        "hasScreen": True,
+                        "isAvailable": True,
+                        "isConditional": False,
+                        "isGlobal": False,
+                        "isInitial": False,
                     },
-                    "hasScreen": True,
-                    "isAvailable": True,
-                    "isConditional": False,
-                    "isGlobal": False,
-                    "isInitial": False
-                }
-            ]
-        }
-        mock_response.raise_for_status.return_value = None
-        
-        # Setup mock client
-        mock_client_instance = Mock()
-        mock_client_instance.request.return_value = mock_response
-        mock_async_client.return_value = mock_client_instance
+                ]
+            }
+        )
 
         client = JiraV3APIClient(
             server_url="https://test.atlassian.net",
             username="testuser",
             token="testtoken",
         )
+        client.client = AsyncMock()
+        client.client.request.return_value = mock_response
 
         result = await client.get_transitions("PROJ-123")
 
@@ -382,32 +392,28 @@ class TestJiraV3APIClient:
         assert result["transitions"][0]["name"] == "Close Issue"
         assert result["transitions"][1]["id"] == "711"
         assert result["transitions"][1]["name"] == "QA Review"
-        
+
         # Verify the request was made with correct parameters
-        mock_client_instance.request.assert_called_once()
-        call_args = mock_client_instance.request.call_args
+        client.client.request.assert_called_once()
+        call_args = client.client.request.call_args
         assert call_args[1]["method"] == "GET"
         assert "/rest/api/3/issue/PROJ-123/transitions" in call_args[1]["url"]
 
-    @patch("src.mcp_server_jira.jira_v3_api.httpx.AsyncClient")
-    async def test_get_transitions_with_parameters(self, mock_async_client):
+    @pytest.mark.asyncio
+    async def test_get_transitions_with_parameters(self):
         """Test get transitions with query parameters"""
         # Setup mock response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"transitions": []}
-        mock_response.raise_for_status.return_value = None
-        
-        # Setup mock client
-        mock_client_instance = Mock()
-        mock_client_instance.request.return_value = mock_response
-        mock_async_client.return_value = mock_client_instance
+        mock_response.content = orjson.dumps({"transitions": []})
 
         client = JiraV3APIClient(
             server_url="https://test.atlassian.net",
             username="testuser",
             token="testtoken",
         )
+        client.client = AsyncMock()
+        client.client.request.return_value = mock_response
 
         await client.get_transitions(
             issue_id_or_key="PROJ-123",
@@ -415,14 +421,14 @@ class TestJiraV3APIClient:
             transition_id="2",
             skip_remote_only_condition=True,
             include_unavailable_transitions=False,
-            sort_by_ops_bar_and_status=True
+            sort_by_ops_bar_and_status=True,
         )
 
         # Verify the request was made with correct parameters
-        mock_client_instance.request.assert_called_once()
-        call_args = mock_client_instance.request.call_args
+        client.client.request.assert_called_once()
+        call_args = client.client.request.call_args
         assert call_args[1]["method"] == "GET"
-        
+
         params = call_args[1]["params"]
         assert params["expand"] == "transitions.fields"
         assert params["transitionId"] == "2"
@@ -430,6 +436,7 @@ class TestJiraV3APIClient:
         assert params["includeUnavailableTransitions"] is False
         assert params["sortByOpsBarAndStatus"] is True
 
+    @pytest.mark.asyncio
     async def test_get_transitions_missing_issue_key(self):
         """Test get transitions with missing issue key"""
         client = JiraV3APIClient(
@@ -440,3 +447,651 @@ class TestJiraV3APIClient:
 
         with pytest.raises(ValueError, match="issue_id_or_key is required"):
             await client.get_transitions("")
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_client(self):
+        """Test that leaving the async context closes the pooled HTTP client"""
+        client = JiraV3APIClient(
+            server_url="https://context-manager.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        http_client = client.client
+
+        async with client as entered:
+            assert entered is client
+
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_http_client_shared_between_instances(self):
+        """Test that clients for the same site and credentials share a pool"""
+        first = JiraV3APIClient(
+            server_url="https://shared-pool.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        second = JiraV3APIClient(
+            server_url="https://shared-pool.atlassian.net/",
+            username="testuser",
+            token="testtoken",
+        )
+        other_user = JiraV3APIClient(
+            server_url="https://shared-pool.atlassian.net",
+            username="otheruser",
+            token="testtoken",
+        )
+
+        assert first.client is second.client
+        assert other_user.client is not first.client
+        # The request budget is per site, not per instance
+        assert first._rate_limiter is second._rate_limiter
+        assert first._request_slots is second._request_slots
+
+        await first.aclose()
+        await first.aclose()
+        assert not second.client.is_closed
+
+        await second.aclose()
+        assert second.client.is_closed
+
+        await other_user.aclose()
+
+    def test_pool_keeps_a_connection_per_batch_worker(self):
+        """Test that a full batch's connections stay alive between bursts"""
+        limits = jira_v3_api.HTTP_POOL_LIMITS
+
+        assert limits.max_keepalive_connections >= jira_v3_api.DEFAULT_MAX_WORKERS
+        assert limits.keepalive_expiry is not None
+
+    def test_http_client_not_shared_across_event_loops(self):
+        """Test that each event loop gets its own pooled HTTP client"""
+
+        async def open_client():
+            client = JiraV3APIClient(
+                server_url="https://loop-scoped.atlassian.net",
+                username="testuser",
+                token="testtoken",
+            )
+            return client.client
+
+        first = asyncio.run(open_client())
+        second = asyncio.run(open_client())
+
+        assert second is not first
+        assert all(
+            shared.client is not first
+            for shared in jira_v3_api._shared_clients.values()
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_projects_concurrently(self):
+        """Test creating several projects with bounded concurrency"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_create_project(**spec):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if spec["key"] == "BAD":
+                raise ValueError("Jira API returned an error: 400 Bad Request.")
+            return {"key": spec["key"]}
+
+        client.create_project = fake_create_project
+
+        specs = [
+            {"key": "ONE", "assignee": "acc-1"},
+            {"key": "BAD", "assignee": "acc-1"},
+            {"key": "TWO", "assignee": "acc-1"},
+        ]
+        results = await client.create_projects(specs, max_workers=2)
+
+        assert results[0] == {"key": "ONE"}
+        assert isinstance(results[1], ValueError)
+        assert results[2] == {"key": "TWO"}
+        assert peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_get_projects_conditional_get(self):
+        """Test that repeated project searches revalidate with the cached ETag"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        page = {"isLast": True, "values": [{"key": "TEST"}]}
+
+        first_response = Mock()
+        first_response.status_code = 200
+        first_response.headers = {"ETag": '"abc"'}
+        first_response.content = orjson.dumps(page)
+
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {"ETag": '"abc"'}
+        not_modified.content = b""
+
+        client.client = AsyncMock()
+        client.client.request.side_effect = [first_response, not_modified]
+
+        first = await client.get_projects(keys=["TEST"])
+        second = await client.get_projects(keys=["TEST"])
+
+        assert first == page
+        assert second == page
+        calls = client.client.request.call_args_list
+        assert calls[0][1]["headers"] is None
+        assert calls[1][1]["headers"] == {"If-None-Match": '"abc"'}
+        not_modified.raise_for_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_all_projects_fetches_pages_concurrently(self):
+        """Test that remaining project pages are fetched together once total is known"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+
+        def page(start_at, max_results, **kwargs):
+            keys = [f"P{i}" for i in range(start_at, min(start_at + max_results, 5))]
+            return {
+                "startAt": start_at,
+                "total": 5,
+                "isLast": start_at + max_results >= 5,
+                "values": [{"key": key} for key in keys],
+            }
+
+        client.get_projects = AsyncMock(side_effect=page)
+
+        projects = await client.get_all_projects(page_size=2, query="P")
+
+        assert [p["key"] for p in projects] == ["P0", "P1", "P2", "P3", "P4"]
+        assert client.get_projects.await_count == 3
+        starts = [c.kwargs["start_at"] for c in client.get_projects.await_args_list]
+        assert starts == [0, 2, 4]
+        assert all(c.kwargs["query"] == "P" for c in client.get_projects.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_get_all_projects_without_total(self):
+        """Test sequential paging when Jira does not report a total"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client.get_projects = AsyncMock(
+            side_effect=[
+                {"isLast": False, "values": [{"key": "A"}, {"key": "B"}]},
+                {"isLast": True, "values": [{"key": "C"}]},
+            ]
+        )
+
+        projects = await client.get_all_projects(page_size=2)
+
+        assert [p["key"] for p in projects] == ["A", "B", "C"]
+        starts = [c.kwargs["start_at"] for c in client.get_projects.await_args_list]
+        assert starts == [0, 2]
+
+    @pytest.mark.asyncio
+    async def test_iter_projects_prefetches_pages(self):
+        """Test that iter_projects yields projects in order across prefetched pages"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+
+        def page(start_at, max_results, **kwargs):
+            keys = [f"P{i}" for i in range(start_at, min(start_at + max_results, 7))]
+            return {
+                "isLast": start_at + max_results >= 7,
+                "values": [{"key": key} for key in keys],
+            }
+
+        client.get_projects = AsyncMock(side_effect=page)
+
+        keys = [p["key"] async for p in client.iter_projects(page_size=2, prefetch=2)]
+
+        assert keys == [f"P{i}" for i in range(7)]
+        starts = [c.kwargs["start_at"] for c in client.get_projects.await_args_list]
+        assert starts == [0, 2, 4, 6, 8]
+
+    @pytest.mark.asyncio
+    async def test_iter_search_issues_stops_on_last_page(self):
+        """Test that iter_search_issues forwards search arguments and stops at isLast"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client.search_issues = AsyncMock(
+            side_effect=[
+                {"isLast": False, "issues": [{"key": "A-1"}, {"key": "A-2"}]},
+                {"isLast": True, "issues": [{"key": "A-3"}]},
+                {"isLast": True, "issues": []},
+            ]
+        )
+
+        keys = [
+            issue["key"]
+            async for issue in client.iter_search_issues(
+                "project = A", page_size=2, prefetch=2, fields="summary"
+            )
+        ]
+
+        assert keys == ["A-1", "A-2", "A-3"]
+        assert all(
+            c.kwargs["fields"] == "summary"
+            for c in client.search_issues.await_args_list
+        )
+
+    @pytest.mark.asyncio
+    async def test_transition_issues_concurrently(self):
+        """Test transitioning several issues with a per-issue selector"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client.get_transitions = AsyncMock(
+            return_value={
+                "transitions": [
+                    {"id": "11", "name": "To Do"},
+                    {"id": "31", "name": "Done"},
+                ]
+            }
+        )
+        client.transition_issue = AsyncMock(return_value={})
+
+        def to_done(transitions):
+            return next(t["id"] for t in transitions if t["name"] == "Done")
+
+        def missing(transitions):
+            raise ValueError("No 'Closed' transition available")
+
+        results = await client.transition_issues(
+            [("PROJ-1", to_done), ("PROJ-2", missing), ("PROJ-3", to_done)],
+            max_workers=2,
+        )
+
+        assert results[0] == {}
+        assert isinstance(results[1], ValueError)
+        assert results[2] == {}
+        client.transition_issue.assert_any_await("PROJ-1", "31")
+        client.transition_issue.assert_any_await("PROJ-3", "31")
+        assert client.transition_issue.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_create_project_payload_omits_unset_fields(self):
+        """Test that only provided optional fields are sent to Jira"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client._make_v3_api_request = AsyncMock(return_value={"id": "10000"})
+
+        await client.create_project(
+            key="TEST",
+            assignee="acc-1",
+            ptype="software",
+            avatarId=10200,
+            projectCategory=10001,
+        )
+
+        client._make_v3_api_request.assert_awaited_once_with(
+            "POST",
+            "/project",
+            data={
+                "key": "TEST",
+                "name": "TEST",
+                "leadAccountId": "acc-1",
+                "assigneeType": "PROJECT_LEAD",
+                "projectTypeKey": "software",
+                "avatarId": 10200,
+                "categoryId": 10001,
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_make_v3_api_request_non_json_response(self):
+        """Test that a non-JSON success body raises a clear error"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b"<html>Service Unavailable</html>"
+        mock_response.text = "<html>Service Unavailable</html>"
+
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client.client = AsyncMock()
+        client.client.request.return_value = mock_response
+
+        with pytest.raises(ValueError, match="non-JSON response"):
+            await client._make_v3_api_request("GET", "/project/search")
+
+    def test_basic_auth_header_prebuilt(self):
+        """Test that the Basic auth header is encoded once on the client"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+
+        expected = "Basic dGVzdHVzZXI6dGVzdHRva2Vu"
+        assert client._auth_header == expected
+        assert client.client.headers["Authorization"] == expected
+
+    def test_init_requires_server_url(self):
+        """Test that a missing server URL is rejected up front"""
+        with pytest.raises(ValueError, match="server URL is required"):
+            JiraV3APIClient(server_url=None, username="testuser", token="testtoken")
+
+    @pytest.mark.asyncio
+    async def test_make_v3_api_request_error_with_oversized_body(self):
+        """Test that oversized error bodies are not parsed"""
+        from httpx import HTTPStatusError, Request
+
+        mock_response = Mock()
+        mock_response.status_code = 400
+        mock_response.reason_phrase = "Bad Request"
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.content = orjson.dumps(
+            {"errorMessages": ["x" * ERROR_BODY_LIMIT], "errors": {}}
+        )
+
+        mock_request = Mock(spec=Request)
+        mock_request.url = "https://test.atlassian.net/rest/api/3/issuetype"
+
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client.client = AsyncMock()
+        client.client.request.side_effect = HTTPStatusError(
+            "400 Bad Request", request=mock_request, response=mock_response
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            await client._make_v3_api_request("GET", "/issuetype")
+
+        assert str(exc_info.value) == "Jira API returned an error: 400 Bad Request."
+
+    @pytest.mark.asyncio
+    async def test_make_v3_api_request_error_with_message_body(self):
+        """Test that a plain {"message": ...} error body is reported"""
+        from httpx import HTTPStatusError, Request
+
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.reason_phrase = "Not Found"
+        mock_response.headers = {"Content-Type": "application/json;charset=UTF-8"}
+        mock_response.content = orjson.dumps(
+            {"message": "No project could be found.", "status-code": 404}
+        )
+
+        mock_request = Mock(spec=Request)
+        mock_request.url = "https://test.atlassian.net/rest/api/3/project/NOPE"
+
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client.client = AsyncMock()
+        client.client.request.side_effect = HTTPStatusError(
+            "404 Not Found", request=mock_request, response=mock_response
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            await client._make_v3_api_request("GET", "/project/NOPE")
+
+        assert str(exc_info.value) == (
+            "Jira API returned an error: 404 Not Found. No project could be found."
+        )
+
+    @pytest.mark.asyncio
+    async def test_make_v3_api_request_error_with_bulk_error_list(self):
+        """Test that bulk endpoints' per-element error lists are reported"""
+        from httpx import HTTPStatusError, Request
+
+        mock_response = Mock()
+        mock_response.status_code = 400
+        mock_response.reason_phrase = "Bad Request"
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.content = orjson.dumps(
+            {
+                "issues": [],
+                "errors": [
+                    {
+                        "status": 400,
+                        "elementErrors": {
+                            "errorMessages": [],
+                            "errors": {"summary": "Summary is required."},
+                        },
+                        "failedElementNumber": 1,
+                    }
+                ],
+            }
+        )
+
+        mock_request = Mock(spec=Request)
+        mock_request.url = "https://test.atlassian.net/rest/api/3/issue/bulk"
+
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client.client = AsyncMock()
+        client.client.request.side_effect = HTTPStatusError(
+            "400 Bad Request", request=mock_request, response=mock_response
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            await client.bulk_create_issues(
+                [{"fields": {"project": {"key": "PROJ"}}}]
+            )
+
+        assert str(exc_info.value) == (
+            "Jira API returned an error: 400 Bad Request. "
+            "issue 1: summary: Summary is required."
+        )
+
+    @pytest.mark.asyncio
+    async def test_make_v3_api_request_error_with_html_body(self):
+        """Test that non-JSON error bodies are not parsed"""
+        from httpx import HTTPStatusError, Request
+
+        mock_response = Mock()
+        mock_response.status_code = 503
+        mock_response.reason_phrase = "Service Unavailable"
+        mock_response.headers = {"Content-Type": "text/html"}
+        mock_response.content = b"<html>Service Unavailable</html>"
+
+        mock_request = Mock(spec=Request)
+        mock_request.url = "https://test.atlassian.net/rest/api/3/issuetype"
+
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client.client = AsyncMock()
+        client.client.request.side_effect = HTTPStatusError(
+            "503 Service Unavailable", request=mock_request, response=mock_response
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            await client._make_v3_api_request("GET", "/issuetype")
+
+        assert str(exc_info.value) == (
+            "Jira API returned an error: 503 Service Unavailable."
+        )
+
+    @pytest.mark.asyncio
+    async def test_make_v3_api_request_error_status_without_raise_for_status(self):
+        """Test that error statuses are turned into ValueError from the response"""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.reason_phrase = "Not Found"
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.content = orjson.dumps(
+            {"errorMessages": ["Issue does not exist"], "errors": {}}
+        )
+
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client.client = AsyncMock()
+        client.client.request.return_value = mock_response
+
+        with pytest.raises(ValueError) as exc_info:
+            await client._make_v3_api_request("GET", "/issue/X-1")
+
+        assert str(exc_info.value) == (
+            "Jira API returned an error: 404 Not Found. Issue does not exist"
+        )
+        mock_response.raise_for_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_make_v3_api_request_retries_rate_limited_response(self):
+        """Test that a 429 is retried after Jira's Retry-After delay"""
+        rate_limited = Mock()
+        rate_limited.status_code = 429
+        rate_limited.headers = {"Retry-After": "2"}
+
+        ok = Mock()
+        ok.status_code = 200
+        ok.headers = {}
+        ok.content = orjson.dumps({"ok": True})
+
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client.client = AsyncMock()
+        client.client.request.side_effect = [rate_limited, ok]
+        client._retry_sleep = AsyncMock()
+
+        result = await client._make_v3_api_request("POST", "/issue", data={"a": 1})
+
+        assert result == {"ok": True}
+        assert client.client.request.await_count == 2
+        client._retry_sleep.assert_awaited_once_with(2.0)
+        calls = client.client.request.call_args_list
+        assert calls[0][1]["content"] == calls[1][1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_make_v3_api_request_gives_up_after_retries(self):
+        """Test that repeated 503s back off exponentially and then raise"""
+        from httpx import HTTPStatusError, Request
+
+        mock_request = Mock(spec=Request)
+        mock_request.url = "https://test.atlassian.net/rest/api/3/issuetype"
+
+        unavailable = Mock()
+        unavailable.status_code = 503
+        unavailable.reason_phrase = "Service Unavailable"
+        unavailable.headers = {}
+        unavailable.content = b""
+        unavailable.raise_for_status.side_effect = HTTPStatusError(
+            "503 Service Unavailable", request=mock_request, response=unavailable
+        )
+
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client.client = AsyncMock()
+        client.client.request.return_value = unavailable
+        client._retry_sleep = AsyncMock()
+
+        with pytest.raises(ValueError, match="503 Service Unavailable"):
+            await client._make_v3_api_request("GET", "/issuetype")
+
+        assert client.client.request.await_count == jira_v3_api.HTTP_RETRY_ATTEMPTS
+        delays = [c.args[0] for c in client._retry_sleep.await_args_list]
+        assert delays == [1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_get_issue_types_is_cached(self):
+        """Test that issue types are fetched once until the cache is invalidated"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        issue_types = [{"id": "10001", "name": "Bug"}]
+        client._make_v3_api_request = AsyncMock(return_value=issue_types)
+
+        assert await client.get_issue_types() == issue_types
+        assert await client.get_issue_types() == issue_types
+        client._make_v3_api_request.assert_awaited_once_with("GET", "/issuetype")
+
+        client.invalidate_cache()
+        await client.get_issue_types()
+        assert client._make_v3_api_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_issue_types_cache_expires(self):
+        """Test that cached issue types are copied out and refetched after the TTL"""
+        client = JiraV3APIClient(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        client._make_v3_api_request = AsyncMock(
+            return_value=[{"id": "10001", "name": "Bug"}]
+        )
+
+        first = await client.get_issue_types()
+        first[0]["name"] = "Changed by caller"
+
+        assert (await client.get_issue_types())[0]["name"] == "Bug"
+        assert client._make_v3_api_request.await_count == 1
+
+        # Age the cached entry past the TTL
+        fetched_at, response = client._response_cache["/issuetype"]
+        client._response_cache["/issuetype"] = (
+            fetched_at - jira_v3_api.RESPONSE_CACHE_TTL,
+            response,
+        )
+
+        await client.get_issue_types()
+        assert client._make_v3_api_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_waits_once_burst_is_spent(self):
+        """Test that requests beyond the burst wait for the bucket to refill"""
+        clock = [0.0]
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            clock[0] += delay
+
+        bucket = jira_v3_api._TokenBucket(
+            rate=4.0, capacity=2, clock=lambda: clock[0], sleep=fake_sleep
+        )
+        for _ in range(3):
+            await bucket.acquire()
+
+        assert sleeps == [0.25]
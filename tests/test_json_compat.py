@@ -0,0 +1,51 @@
+"""
+Tests for the JSON helpers.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+from src.mcp_server_jira import json_compat
+
+
+@pytest.fixture
+def stdlib_json(monkeypatch):
+    """Reload json_compat as if orjson were not installed"""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    yield importlib.reload(json_compat)
+    monkeypatch.undo()
+    importlib.reload(json_compat)
+
+
+class TestJsonCompat:
+    """Test suite for json_compat"""
+
+    def test_round_trip(self):
+        """Test that values survive dumps/loads as bytes"""
+        value = {"summary": "Café", "labels": ["a", "b"], "count": 2}
+
+        data = json_compat.dumps(value)
+
+        assert isinstance(data, bytes)
+        assert json_compat.loads(data) == value
+
+    def test_stdlib_fallback_matches_orjson(self, stdlib_json):
+        """Test that the stdlib fallback produces the same compact bytes"""
+        pytest.importorskip("orjson")
+        import orjson
+
+        value = {"summary": "Café", "labels": ["a", "b"], "count": 2}
+
+        assert stdlib_json.orjson is None
+        assert stdlib_json.dumps(value) == orjson.dumps(value)
+        assert stdlib_json.loads(stdlib_json.dumps(value)) == value
+        assert stdlib_json.dumps_pretty(value) == orjson.dumps(
+            value, option=orjson.OPT_INDENT_2
+        ).decode()
+
+    def test_stdlib_fallback_decode_error(self, stdlib_json):
+        """Test that invalid input raises the shared JSONDecodeError"""
+        with pytest.raises(stdlib_json.JSONDecodeError):
+            stdlib_json.loads(b"<html>")
@@ -2,6 +2,7 @@
 
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock
+import orjson
 import pytest
 
 from src.mcp_server_jira.jira_v3_api import JiraV3APIClient
@@ -17,7 +18,7 @@ class TestSearchIssuesV3API:
         # Mock successful search response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "issues": [
                 {
                     "key": "PROJ-123",
@@ -48,7 +49,7 @@ class TestSearchIssuesV3API:
             "maxResults": 50,
             "total": 2,
             "isLast": True
-        }
+        })
         mock_response.text = ""
         mock_response.raise_for_status.return_value = None
 
@@ -90,13 +91,13 @@ class TestSearchIssuesV3API:
         # Mock successful search response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "issues": [],
             "startAt": 0,
             "maxResults": 25,
             "total": 0,
             "isLast": True
-        }
+        })
         mock_response.text = ""
         mock_response.raise_for_status.return_value = None
 
@@ -153,7 +154,8 @@ class TestSearchIssuesV3API:
         mock_response = Mock()
         mock_response.status_code = 400
         mock_response.reason_phrase = "Bad Request"
-        mock_response.json.return_value = {"errorMessages": ["Invalid JQL"]}
+        mock_response.content = orjson.dumps({"errorMessages": ["Invalid JQL"]})
+        mock_response.headers = {"Content-Type": "application/json;charset=UTF-8"}
         
         from httpx import HTTPStatusError, Request, Response
         mock_request = Mock(spec=Request)
@@ -174,9 +176,11 @@ class TestSearchIssuesV3API:
         # Replace the client instance
         client.client = mock_client
 
-        with pytest.raises(ValueError, match="Jira API returned an error: 400"):
+        with pytest.raises(ValueError, match="Jira API returned an error: 400") as exc_info:
             await client.search_issues(jql="invalid jql syntax")
 
+        assert "Invalid JQL" in str(exc_info.value)
+
 
 class TestSearchIssuesJiraServer:
     """Test suite for search_issues in JiraServer class"""
@@ -500,4 +504,57 @@ class TestSearchIssuesJiraServer:
         assert result[4]["key"] == "TEST-5"
 
         # Verify pagination stopped at the right point
-        assert mock_v3_client.search_issues.call_count == 2
\ No newline at end of file
+        assert mock_v3_client.search_issues.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_server_search_issues_fetches_remaining_pages_concurrently(self):
+        """Test that pages after the first are requested together once total is known"""
+
+        async def search(jql, start_at, max_results):
+            end = min(start_at + max_results, 250)
+            return {
+                "issues": [{"key": f"TEST-{i}"} for i in range(start_at, end)],
+                "total": 250,
+                "isLast": end >= 250,
+            }
+
+        mock_v3_client = AsyncMock()
+        mock_v3_client.search_issues.side_effect = search
+
+        server = JiraServer()
+        server.server_url = "https://test.atlassian.net"
+        server.username = "testuser"
+        server.token = "testtoken"
+
+        with patch.object(server, '_get_v3_api_client', return_value=mock_v3_client):
+            result = await server.search_jira_issues("project = TEST", max_results=220)
+
+        assert [issue["key"] for issue in result] == [f"TEST-{i}" for i in range(220)]
+        calls = [
+            (c[1]["start_at"], c[1]["max_results"])
+            for c in mock_v3_client.search_issues.call_args_list
+        ]
+        assert calls == [(0, 100), (100, 100), (200, 20)]
+
+    @pytest.mark.asyncio
+    async def test_server_search_issues_with_fields(self):
+        """Test that requested fields are passed through to the V3 API"""
+        mock_v3_client = AsyncMock()
+        mock_v3_client.search_issues.return_value = {
+            "issues": [{"key": "TEST-1", "fields": {"summary": "Only summary"}}]
+        }
+
+        server = JiraServer()
+        server.server_url = "https://test.atlassian.net"
+        server.username = "testuser"
+        server.token = "testtoken"
+
+        with patch.object(server, '_get_v3_api_client', return_value=mock_v3_client):
+            result = await server.search_jira_issues(
+                "project = TEST", max_results=10, fields="summary"
+            )
+
+        assert result[0]["fields"] == {"summary": "Only summary"}
+        mock_v3_client.search_issues.assert_called_once_with(
+            jql="project = TEST", start_at=0, max_results=10, fields="summary"
+        )
@@ -6,7 +6,17 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from src.mcp_server_jira.server import JiraProjectResult, JiraServer
+from src.mcp_server_jira.server import (
+    ISSUE_CACHE_TTL,
+    JIRA_TIMEOUT,
+    JiraIssueResult,
+    JiraProjectResult,
+    JiraServer,
+    JiraTools,
+    _FIELD_NORMALIZERS,
+    _TOOLS,
+    _closest_issue_type,
+)
 
 
 class TestJiraServer:
@@ -26,27 +36,23 @@ class TestJiraServer:
         assert server.username == "testuser"
         assert server.token == "testtoken"
 
+    @pytest.mark.asyncio
     @patch.object(JiraServer, "_get_v3_api_client")
-    def test_get_jira_projects(self, mock_get_v3_api_client):
+    async def test_get_jira_projects(self, mock_get_v3_api_client):
         """Test getting Jira projects using v3 API"""
         # Setup mock v3 client
         mock_v3_client = Mock()
-        mock_v3_client.get_projects.return_value = {
-            "startAt": 0,
-            "maxResults": 50,
-            "total": 1,
-            "isLast": True,
-            "values": [
+        mock_v3_client.get_all_projects = AsyncMock(
+            return_value=[
                 {
                     "id": "123",
                     "key": "TEST",
                     "name": "Test Project",
-                    "lead": {
-                        "displayName": "John Doe"
-                    }
-                }
+                    "lead": {"displayName": "John Doe"},
+                },
+                {"id": "10001", "key": "TEST2", "name": "Test Project 2"},
             ]
-        }
+        )
         mock_get_v3_api_client.return_value = mock_v3_client
 
         server = JiraServer(
@@ -57,90 +63,33 @@ class TestJiraServer:
         )
 
         # Call the method
-        projects = server.get_jira_projects()
+        projects = await server.get_jira_projects()
 
         # Verify results
-        assert len(projects) == 1
+        assert len(projects) == 2
         assert isinstance(projects[0], JiraProjectResult)
         assert projects[0].key == "TEST"
         assert projects[0].name == "Test Project"
         assert projects[0].id == "123"
         assert projects[0].lead == "John Doe"
+        assert projects[1].key == "TEST2"
+        assert projects[1].lead is None
 
         # Verify v3 client was called correctly
-        mock_v3_client.get_projects.assert_called_with(
-            start_at=0,
-            max_results=50
-        )
-
-    @patch.object(JiraServer, "_get_v3_api_client")
-    def test_get_jira_projects_pagination(self, mock_get_v3_api_client):
-        """Test getting Jira projects with pagination"""
-        # Setup mock v3 client with pagination
-        mock_v3_client = Mock()
-        
-        # First page response
-        page1_response = {
-            "startAt": 0,
-            "maxResults": 2,
-            "total": 3,
-            "isLast": False,
-            "values": [
-                {"id": "10000", "key": "TEST1", "name": "Test Project 1"},
-                {"id": "10001", "key": "TEST2", "name": "Test Project 2"}
-            ]
-        }
-        
-        # Second page response  
-        page2_response = {
-            "startAt": 2,
-            "maxResults": 2,
-            "total": 3,
-            "isLast": True,
-            "values": [
-                {"id": "10002", "key": "TEST3", "name": "Test Project 3"}
-            ]
-        }
-        
-        # Configure mock to return different responses for each call
-        mock_v3_client.get_projects.side_effect = [page1_response, page2_response]
-        mock_get_v3_api_client.return_value = mock_v3_client
-
-        server = JiraServer(
-            server_url="https://test.atlassian.net",
-            auth_method="token",
-            username="testuser",
-            token="testtoken",
-        )
-
-        # Call the method
-        projects = server.get_jira_projects()
-
-        # Should have called get_projects twice due to pagination
-        assert mock_v3_client.get_projects.call_count == 2
-        
-        # Should have collected all 3 projects
-        assert len(projects) == 3
-        assert projects[0].key == "TEST1"
-        assert projects[1].key == "TEST2"
-        assert projects[2].key == "TEST3"
-        
-        # Verify correct pagination parameters
-        calls = mock_v3_client.get_projects.call_args_list
-        assert calls[0][1]["start_at"] == 0
-        assert calls[1][1]["start_at"] == 2
+        mock_v3_client.get_all_projects.assert_awaited_once_with()
 
+    @pytest.mark.asyncio
     @patch.object(JiraServer, "_get_v3_api_client")
-    def test_create_jira_project_v3_api(self, mock_get_v3_api_client):
+    async def test_create_jira_project_v3_api(self, mock_get_v3_api_client):
         """Test project creation using v3 API"""
         # Setup mock v3 client
         mock_v3_client = Mock()
-        mock_v3_client.create_project.return_value = {
+        mock_v3_client.create_project = AsyncMock(return_value={
             "self": "https://test.atlassian.net/rest/api/3/project/10000",
             "id": "10000",
             "key": "TEST",
             "name": "Test Project",
-        }
+        })
         mock_get_v3_api_client.return_value = mock_v3_client
 
         server = JiraServer(
@@ -151,7 +100,7 @@ class TestJiraServer:
         )
 
         # Call the method
-        result = server.create_jira_project(
+        result = await server.create_jira_project(
             key="TEST", name="Test Project", ptype="software"
         )
 
@@ -161,7 +110,7 @@ class TestJiraServer:
         assert result.name == "Test Project"
 
         # Verify v3 client was called correctly
-        mock_v3_client.create_project.assert_called_once_with(
+        mock_v3_client.create_project.assert_awaited_once_with(
             key="TEST",
             name="Test Project",
             assignee=None,
@@ -173,20 +122,21 @@ class TestJiraServer:
             projectCategory=None,
             notificationScheme=None,
             categoryId=None,
-            url="",
+            url=None,
         )
 
+    @pytest.mark.asyncio
     @patch.object(JiraServer, "_get_v3_api_client")
-    def test_create_jira_project_with_template(self, mock_get_v3_api_client):
+    async def test_create_jira_project_with_template(self, mock_get_v3_api_client):
         """Test project creation with template using v3 API"""
         # Setup mock v3 client
         mock_v3_client = Mock()
-        mock_v3_client.create_project.return_value = {
+        mock_v3_client.create_project = AsyncMock(return_value={
             "self": "https://test.atlassian.net/rest/api/3/project/10000",
             "id": "10000",
             "key": "TEMP",
             "name": "Template Project",
-        }
+        })
         mock_get_v3_api_client.return_value = mock_v3_client
 
         server = JiraServer(
@@ -197,7 +147,7 @@ class TestJiraServer:
         )
 
         # Call the method with template
-        result = server.create_jira_project(
+        result = await server.create_jira_project(
             key="TEMP",
             name="Template Project",
             ptype="business",
@@ -211,7 +161,7 @@ class TestJiraServer:
         assert result.name == "Template Project"
 
         # Verify v3 client was called with template parameters
-        mock_v3_client.create_project.assert_called_once_with(
+        mock_v3_client.create_project.assert_awaited_once_with(
             key="TEMP",
             name="Template Project",
             assignee="user123",
@@ -223,7 +173,7 @@ class TestJiraServer:
             projectCategory=None,
             notificationScheme=None,
             categoryId=None,
-            url="",
+            url=None,
         )
 
     def test_get_v3_api_client(self):
@@ -239,8 +189,7 @@ class TestJiraServer:
 
         assert client.server_url == "https://test.atlassian.net"
         assert client.username == "testuser"
-        assert client.token == "testtoken"
-        assert client.password is None
+        assert client.auth_token == "testtoken"
 
     def test_get_v3_api_client_with_password(self):
         """Test v3 client creation with password"""
@@ -255,5 +204,193 @@ class TestJiraServer:
 
         assert client.server_url == "https://test.atlassian.net"
         assert client.username == "testuser"
-        assert client.password == "testpass"
-        assert client.token is None
+        assert client.auth_token == "testpass"
+
+    def test_v3_api_client_created_lazily(self):
+        """Test that the v3 client is only built on first use"""
+        server = JiraServer(server_url="https://test.atlassian.net")
+
+        assert server._v3_client is None
+        with pytest.raises(ValueError, match="Set JIRA_USERNAME"):
+            server._get_v3_api_client()
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_v3_api_client(self):
+        """Test that aclose closes and drops a created v3 client"""
+        server = JiraServer(
+            server_url="https://aclose.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        http_client = server._get_v3_api_client().client
+
+        await server.aclose()
+
+        assert http_client.is_closed
+        assert server._v3_client is None
+
+    @pytest.mark.asyncio
+    async def test_get_jira_issue_is_cached_until_modified(self):
+        """Test that issues are reused until their TTL ends or they are modified"""
+        server = JiraServer(
+            server_url="https://test.atlassian.net",
+            username="testuser",
+            token="testtoken",
+        )
+        issue = JiraIssueResult(key="TEST-1", summary="Cached", fields={"a": 1})
+        mock_v3_client = Mock()
+        mock_v3_client.add_comment = AsyncMock(return_value={"id": "1"})
+
+        with patch.object(
+            server, "_fetch_jira_issue", return_value=issue
+        ) as mock_fetch, patch.object(
+            server, "_get_v3_api_client", return_value=mock_v3_client
+        ):
+            first = server.get_jira_issue("TEST-1")
+            first.fields["a"] = 2
+            second = server.get_jira_issue("TEST-1")
+            assert mock_fetch.call_count == 1
+            assert second.fields == {"a": 1}
+
+            await server.add_jira_comment("TEST-1", "hello")
+            server.get_jira_issue("TEST-1")
+            assert mock_fetch.call_count == 2
+
+            # Age the entry past its TTL
+            fetched_at, result = server._issue_cache["TEST-1"]
+            server._issue_cache["TEST-1"] = (fetched_at - ISSUE_CACHE_TTL, result)
+            server.get_jira_issue("TEST-1")
+            assert mock_fetch.call_count == 3
+
+    def test_get_jira_issue_reads_raw_json(self):
+        """Test that the issue result is built from the issue's raw field data"""
+        server = JiraServer(server_url="https://test.atlassian.net")
+        issue = Mock()
+        issue.key = "TEST-1"
+        issue.raw = {
+            "fields": {
+                "summary": "Summary",
+                "status": {"name": "Open"},
+                "assignee": None,
+                "reporter": {"displayName": "Reporter"},
+                "created": "2023-01-01",
+                "comment": {
+                    "comments": [
+                        {
+                            "author": {"displayName": "Commenter"},
+                            "body": "Looks good",
+                            "created": "2023-01-03",
+                        }
+                    ]
+                },
+                "priority": {"name": "High", "id": "2"},
+                "customfield_1": {"value": "Option A"},
+                "components": [{"name": "API"}, {"name": "UI"}],
+                "labels": ["one", "two"],
+                "customfield_2": 3.0,
+                "customfield_3": None,
+                "subtasks": [],
+            }
+        }
+        server.client = Mock()
+        server.client.issue.return_value = issue
+
+        result = server.get_jira_issue("TEST-1")
+
+        assert result.summary == "Summary"
+        assert result.status == "Open"
+        assert result.assignee is None
+        assert result.reporter == "Reporter"
+        assert result.updated is None
+        assert result.comments == [
+            {"author": "Commenter", "body": "Looks good", "created": "2023-01-03"}
+        ]
+        assert result.fields == {
+            "priority": "High",
+            "customfield_1": "Option A",
+            "components": ["API", "UI"],
+            "labels": ["one", "two"],
+            "customfield_2": "3.0",
+        }
+
+    def test_connect_makes_a_single_attempt(self):
+        """Test that connect picks one auth method and does not fall back"""
+        server = JiraServer(
+            server_url="https://test.atlassian.net",
+            auth_method="basic_auth",
+            username="testuser",
+            password="testpass",
+            token="testtoken",
+        )
+        mock_jira = Mock(side_effect=RuntimeError("401 Unauthorized"))
+
+        with patch(
+            "src.mcp_server_jira.server._jira_class", return_value=mock_jira
+        ):
+            assert server.connect() is False
+
+        mock_jira.assert_called_once_with(
+            server="https://test.atlassian.net",
+            timeout=JIRA_TIMEOUT,
+            basic_auth=("testuser", "testtoken"),
+        )
+
+    def test_connect_with_token_auth(self):
+        """Test that token_auth uses the token on its own"""
+        server = JiraServer(
+            server_url="https://jira.example.com",
+            auth_method="token_auth",
+            username="testuser",
+            token="testtoken",
+        )
+        mock_jira = Mock()
+
+        with patch(
+            "src.mcp_server_jira.server._jira_class", return_value=mock_jira
+        ):
+            assert server.connect() is True
+
+        assert server.client is mock_jira.return_value
+        mock_jira.assert_called_once_with(
+            server="https://jira.example.com",
+            timeout=JIRA_TIMEOUT,
+            token_auth="testtoken",
+        )
+
+    def test_closest_issue_type(self):
+        """Test issue type suggestions for substring matches and typos"""
+        type_names = ["Bug", "Task", "Sub-task", "Story"]
+
+        assert _closest_issue_type("bugs", type_names) == "Bug"
+        assert _closest_issue_type("Tsak", type_names) == "Task"
+        assert _closest_issue_type("Incident", type_names) is None
+        assert _closest_issue_type("subtask", type_names) == "Sub-task"
+        assert _closest_issue_type("new-feature", ["Task", "New Feature"]) == (
+            "New Feature"
+        )
+        assert _closest_issue_type("--", type_names) is None
+
+    def test_field_normalizers(self):
+        """Test conversion of extra issue fields to Jira's formats"""
+        assert _FIELD_NORMALIZERS["assignees"]("alice") == ["alice"]
+        assert _FIELD_NORMALIZERS["assignee"]("alice") == {"name": "alice"}
+        assert _FIELD_NORMALIZERS["assignee"](["alice", "bob"]) == {"name": "alice"}
+        assert _FIELD_NORMALIZERS["assignee"]("") is None
+        assert _FIELD_NORMALIZERS["labels"]("") == []
+        assert _FIELD_NORMALIZERS["labels"](["a", "b"]) == ["a", "b"]
+        assert _FIELD_NORMALIZERS["milestone"]("12") == 12
+        assert _FIELD_NORMALIZERS["milestone"]("v2") == "v2"
+
+    def test_tool_descriptors_cover_every_tool(self):
+        """Test that the prebuilt tool list describes each tool exactly once"""
+        assert sorted(tool.name for tool in _TOOLS) == sorted(
+            tool.value for tool in JiraTools
+        )
+
+    def test_get_v3_api_client_without_server_url(self):
+        """Test that a missing server URL fails before any client is built"""
+        server = JiraServer(username="testuser", token="testtoken")
+
+        with pytest.raises(ValueError, match="Set JIRA_SERVER_URL"):
+            server._get_v3_api_client()
+        assert server._v3_client is None
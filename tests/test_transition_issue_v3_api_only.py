@@ -2,6 +2,7 @@
 
 import asyncio
 from unittest.mock import Mock, patch, AsyncMock
+import orjson
 import pytest
 
 from src.mcp_server_jira.jira_v3_api import JiraV3APIClient
@@ -16,7 +17,7 @@ class TestTransitionIssueV3API:
         # Mock 204 No Content response (standard for successful transitions)
         mock_response = Mock()
         mock_response.status_code = 204
-        mock_response.json.return_value = {}
+        mock_response.content = orjson.dumps({})
         mock_response.text = ""
         mock_response.raise_for_status.return_value = None
 
@@ -44,7 +45,7 @@ class TestTransitionIssueV3API:
 
         assert call_args[1]["method"] == "POST"
         assert "/rest/api/3/issue/PROJ-123/transitions" in call_args[1]["url"]
-        assert call_args[1]["json"]["transition"]["id"] == "5"
+        assert orjson.loads(call_args[1]["content"])["transition"]["id"] == "5"
         assert result == {}
 
     @pytest.mark.asyncio
@@ -53,7 +54,7 @@ class TestTransitionIssueV3API:
         # Mock 204 No Content response
         mock_response = Mock()
         mock_response.status_code = 204
-        mock_response.json.return_value = {}
+        mock_response.content = orjson.dumps({})
         mock_response.text = ""
         mock_response.raise_for_status.return_value = None
 
@@ -78,7 +79,7 @@ class TestTransitionIssueV3API:
 
         # Verify the request payload includes properly formatted comment
         call_args = mock_client.request.call_args
-        payload = call_args[1]["json"]
+        payload = orjson.loads(call_args[1]["content"])
         
         assert payload["transition"]["id"] == "2"
         assert "update" in payload
@@ -98,7 +99,7 @@ class TestTransitionIssueV3API:
         # Mock 204 No Content response
         mock_response = Mock()
         mock_response.status_code = 204
-        mock_response.json.return_value = {}
+        mock_response.content = orjson.dumps({})
         mock_response.text = ""
         mock_response.raise_for_status.return_value = None
 
@@ -128,7 +129,7 @@ class TestTransitionIssueV3API:
 
         # Verify the request payload includes fields
         call_args = mock_client.request.call_args
-        payload = call_args[1]["json"]
+        payload = orjson.loads(call_args[1]["content"])
         
         assert payload["transition"]["id"] == "3"
         assert payload["fields"] == fields